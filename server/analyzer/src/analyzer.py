@@ -1,18 +1,19 @@
 import os
-import json
 import asyncio
-import hashlib
+import itertools
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+import orjson
 from typing import Dict, Any, List, Optional
-from rich.console import Console
-import openai
 from dotenv import load_dotenv
 from datetime import datetime, timezone
 
 from .core.acquire import acquire_target, AcquireResult
 from .core.replit_profile import ReplitProfiler
-from .core.evidence import make_evidence, make_evidence_from_line, make_file_exists_evidence, validate_evidence_list
+from .core.evidence import make_evidence, make_evidence_from_line, make_file_exists_evidence, validate_evidence_list, snippet_hash_12
 from .core.unknowns import compute_known_unknowns
 from .core.adapter import build_evidence_pack, save_evidence_pack
 from .core.render import render_report, save_report, assert_pack_written
@@ -22,6 +23,171 @@ from .schema_validator import validate_operate_json, validate_target_howto_json
 
 load_dotenv()
 
+# Pack classifier patterns, compiled once: a single alternation per category
+# replaces the per-file keyword loops so the scan runs inside the regex engine.
+_DOC_RE = re.compile(r"readme|\.md|doc|changelog", re.I)
+_CFG_RE = re.compile(
+    r"package\.json|requirements\.txt|pyproject\.toml|cargo\.toml|docker|\.env"
+    r"|config|\.replit|replit\.nix|makefile|taskfile|\.github/workflows"
+    r"|tsconfig|vite\.config",
+    re.I,
+)
+_OPS_RE = re.compile(r"dockerfile|docker-compose|\.github|ci|deploy|k8s|helm", re.I)
+# Code is the dominant category, so it dispatches on an O(1) extension-set
+# lookup rather than a regex scan.
+_CODE_EXTS = frozenset({".ts", ".js", ".py", ".go", ".rs", ".java", ".rb", ".tsx", ".jsx"})
+
+# Traversal skip sets, shared by every index_files call.
+_SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", ".pythonlibs", ".cache",
+                        ".local", ".config", "out", ".upm", ".replit_agent"})
+_SKIP_EXTENSIONS = frozenset({".lock", ".png", ".jpg", ".jpeg", ".gif", ".ico",
+                              ".woff", ".woff2", ".ttf", ".eot", ".map"})
+
+# Evidence strings ("path:NN" or "path:NN-MM") are parsed once per evidence
+# item across howto normalization and claim verification — compile once.
+_EVIDENCE_RE = re.compile(r"^([^:]+):(\d+)(?:-(\d+))?")
+_TRAILING_COMMA_RE = re.compile(r",\s*$")
+
+# Shared request structures: built once instead of allocating a fresh dict
+# per LLM call. Treated as immutable by all call sites.
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Pack truncation is expressed as a token budget rather than a raw byte
+# slice. Prompt cost scales with tokens, not bytes, so budgets are converted
+# with a conservative chars-per-token estimate and the cut lands on a line
+# boundary — a dangling partial line is pure wasted prompt spend.
+_APPROX_CHARS_PER_TOKEN = 4
+
+# Shared rich Console, built on first use by get_console().
+_CONSOLE = None
+
+
+def _clip(text: str, max_tokens: int) -> str:
+    """Truncate text to roughly max_tokens, cutting at the last full line."""
+    limit = max_tokens * _APPROX_CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    return text[:cut] if cut > 0 else text[:limit]
+
+# System prompts are static, module-level constants so the same byte-identical
+# prefix opens every request. OpenAI prompt caching only fires on identical
+# leading tokens, so all per-run content (Replit profile, packs) goes in the
+# user message instead of being interpolated here.
+
+HOWTO_SYSTEM_PROMPT = """You are an expert system operator. Analyze the provided evidence to extract a JSON 'Operator Manual' for the target system.
+
+Output this exact JSON schema:
+{
+    "prereqs": ["list of tools/runtimes needed"],
+    "install_steps": [{"step": "description", "command": "command or null", "evidence": "file:line or null"}],
+    "config": [{"name": "env var or config file", "purpose": "what it does", "evidence": "file:line reference"}],
+    "run_dev": [{"step": "description", "command": "command", "evidence": "file:line reference"}],
+    "run_prod": [{"step": "description", "command": "command or unknown", "evidence": "file:line reference or null"}],
+    "usage_examples": [{"description": "what it does", "command": "example command or API call"}],
+    "verification_steps": [{"step": "description", "command": "command", "evidence": "file:line reference"}],
+    "common_failures": [{"symptom": "what happens", "cause": "why", "fix": "how to fix"}],
+    "unknowns": [{"what_is_missing": "description", "why_it_matters": "impact", "what_evidence_needed": "specific evidence"}],
+    "missing_evidence_requests": ["list of things that could not be verified"]
+}
+
+RULES:
+- Every claim MUST cite evidence as file:line.
+- If you cannot cite evidence, mark as unknown and add to "unknowns" AND "missing_evidence_requests".
+- Do NOT invent instructions or steps that are not supported by the provided evidence.
+- If a how-to step has no evidence, set confidence to 0.20 or lower.
+"""
+
+HOWTO_REPLIT_CONTEXT_TEMPLATE = """
+IMPORTANT: This is a Replit workspace. You MUST include a "replit_execution_profile" key in your JSON output.
+
+The Replit profiler detected the following (use this as evidence):
+{profile_json}
+
+The "replit_execution_profile" must contain:
+- "run_command": string (from .replit file, cite .replit:<line>)
+- "language": string
+- "port_binding": object with port, binds_all_interfaces, uses_env_port, evidence array
+- "required_secrets": array of {{"name": "VAR_NAME", "referenced_in": ["file:line"]}}
+- "external_apis": array of {{"api": "name", "evidence_files": ["file"]}}
+- "deployment_assumptions": array of strings
+- "observability": object with logging, health_endpoint, evidence array
+- "limitations": array of strings (things that could not be determined)
+
+Every field must cite evidence. If no evidence exists, set value to null and add to "unknowns".
+Do NOT invent information. If a field cannot be determined, mark it unknown.
+Cap confidence at 0.20 for any claim without direct file:line evidence.
+"""
+
+DOSSIER_REPLIT_SECTION = """
+Additionally, between sections 9 and 11 include:
+10. **Replit Execution Profile**
+    Include ALL of the following subsections with evidence citations (file:line):
+    - Run command (from .replit)
+    - Language/runtime
+    - Port binding (port number, 0.0.0.0 binding, env PORT usage)
+    - Required secrets (names only, NEVER values, cite file:line where each is referenced)
+    - External APIs referenced (with evidence files)
+    - Nix packages required (from replit.nix)
+    - Deployment assumptions
+    - Observability/logging (present or absent, cite evidence)
+    - Limitations (what could NOT be determined)
+"""
+
+DOSSIER_SYSTEM_PROMPT = """You are the 'Program Totality Analyzer'. Write a Markdown DOSSIER about this target system based on static artifacts only.
+
+SCOPE LIMITATION: This dossier is derived from static source artifacts (code, config, lockfiles). It does NOT observe runtime behavior, prove correctness, or certify security. Every claim must be labeled with its epistemic status.
+
+MANDATORY SECTIONS:
+1. **Identity of Target System** (What is it? What is it NOT?)
+2. **Purpose & Jobs-to-be-done**
+3. **Capability Map**
+4. **Architecture Snapshot**
+5. **How to Use the Target System** (Operator manual - refine the provided howto JSON into readable, actionable steps with evidence citations)
+6. **Integration Surface** (APIs, webhooks, SDKs, data formats)
+7. **Data & Security Posture** (Storage, encryption, auth, secret handling)
+8. **Operational Reality** (What it takes to keep running)
+9. **Maintainability & Change Risk**
+11. **Unknowns / Missing Evidence** (What could NOT be determined - be specific)
+12. **Receipts** (Evidence index: list every file:line citation used above)
+
+RULES:
+- Every claim MUST cite evidence as (file:line) inline, pointing to actual source files in the target project.
+- If no evidence exists for a claim, say "UNKNOWN — evidence needed: <describe>" and add to Unknowns section.
+- Label each claim: VERIFIED (hash-anchored to source), INFERRED (derived from context but not hash-verified), or UNKNOWN.
+- Do NOT hallucinate file paths or line numbers. Do NOT use vague adjectives. Be specific and operational.
+- Do NOT cite PTA-generated output (dossier text, claims.json, evidence_pack) as evidence for claims. Evidence must reference the target system's own artifacts.
+- The "How to Use" section must read like an actual operator manual with concrete commands.
+- For Replit projects: the Replit Execution Profile section is MANDATORY.
+- All secrets must be referenced by NAME only, never expose values.
+"""
+
+CLAIMS_SYSTEM_PROMPT = """You are a claims extractor. Given a technical dossier and source evidence packs, extract the TOP 30 most important factual claims made in the dossier. Focus on architecture, runtime, dependencies, and security claims.
+
+For each claim output:
+{
+  "claims": [
+    {
+      "id": "claim_NNN",
+      "section": "section name from dossier",
+      "statement": "the exact claim",
+      "confidence": 0.0-1.0,
+      "evidence": [
+        {"path": "file.ext", "line_start": N, "line_end": N, "display": "file.ext:N"}
+      ],
+      "status": "evidenced | inferred | unknown"
+    }
+  ]
+}
+
+RULES:
+- Limit to 30 claims maximum, prioritizing the most important ones
+- confidence >= 0.80 only if evidence array is non-empty with valid file:line references
+- confidence capped at 0.20 for claims with empty evidence or status "unknown"
+- Do NOT fabricate snippet_hash values; the server computes them
+- Every claim must have at least one evidence entry
+- status "evidenced" = direct file:line proof; "inferred" = reasonable but indirect; "unknown" = no evidence"""
+
 
 class Analyzer:
     def __init__(self, source: str, output_dir: str, mode: str = "github", root: Optional[str] = None, no_llm: bool = False, render_mode: str = "engineer"):
@@ -29,13 +195,17 @@ class Analyzer:
         self.mode = mode
         self.output_dir = Path(output_dir)
         self.packs_dir = self.output_dir / "packs"
-        self.console = Console()
+        self.console = Analyzer.get_console()
         self.replit_profile: Optional[Dict[str, Any]] = None
+        self._replit_profile_json: Optional[str] = None
         self.acquire_result: Optional[AcquireResult] = None
         self.root_scope = root
         self._profiler: Optional[ReplitProfiler] = None
         self._self_skip_paths: set = set()
         self._skipped_count: int = 0
+        self._line_cache: OrderedDict = OrderedDict()
+        self._snippet_hash_cache: Dict[tuple, str] = {}
+        self._repo_dir_str: Optional[str] = None
         self.no_llm = no_llm
         self.render_mode = render_mode
 
@@ -44,14 +214,26 @@ class Analyzer:
 
         self.client = None
         if not no_llm:
-            self.client = openai.OpenAI(
+            # openai is imported lazily: it costs a few hundred ms of import
+            # time that --no-llm runs and --help should not pay.
+            import openai
+            self.client = openai.AsyncOpenAI(
                 api_key=os.environ.get("AI_INTEGRATIONS_OPENAI_API_KEY"),
                 base_url=os.environ.get("AI_INTEGRATIONS_OPENAI_BASE_URL")
             )
+            # Caps in-flight LLM requests so concurrent analyses stay under
+            # the account's rate limit instead of tripping 429s.
+            self._sem = asyncio.Semaphore(int(os.environ.get("OPENAI_CONCURRENCY", "8")))
 
     @staticmethod
     def get_console():
-        return Console()
+        # Console() probes the terminal on construction, so one lazily built
+        # instance is shared by the CLI and every Analyzer.
+        global _CONSOLE
+        if _CONSOLE is None:
+            from rich.console import Console
+            _CONSOLE = Console()
+        return _CONSOLE
 
     def _detect_self_skip(self):
         analyzer_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -66,7 +248,11 @@ class Analyzer:
 
     async def run(self):
         self.console.print("[bold]Step 1: Acquiring target...[/bold]")
-        self.acquire_result = acquire_target(
+        # Acquisition (rmtree of a stale clone plus a network clone) and the
+        # two tree scans below can block for seconds; run them in worker
+        # threads so concurrent analyses sharing this loop stay responsive.
+        self.acquire_result = await asyncio.to_thread(
+            acquire_target,
             target=self.source if self.mode != "replit" else None,
             replit_mode=(self.mode == "replit"),
             output_dir=self.output_dir,
@@ -82,14 +268,19 @@ class Analyzer:
             else:
                 self.console.print(f"[yellow]Warning:[/yellow] --root {self.root_scope} not found, using full target")
 
+        # Precomputed string form of the repo root: Path.__truediv__ re-parses
+        # its operands on every join, which adds up in the per-file and
+        # per-evidence loops below.
+        self._repo_dir_str = str(self.repo_dir)
+
         analyzer_self_root = self._detect_self_skip()
 
         self.console.print("[bold]Step 2: Indexing files...[/bold]")
-        file_index = self.index_files()
+        file_index = await asyncio.to_thread(self.index_files)
         self.console.print(f"  Indexed {len(file_index)} files (skipped {self._skipped_count} self-files)")
 
         self.console.print("[bold]Step 3: Creating evidence packs...[/bold]")
-        packs = self.create_evidence_packs(file_index)
+        packs = await asyncio.to_thread(self.create_evidence_packs, file_index)
 
         if self.mode == "replit":
             self.console.print("[bold]Step 3b: Replit profiling...[/bold]")
@@ -97,11 +288,15 @@ class Analyzer:
             self._profiler = profiler
             self.replit_profile = profiler.detect()
             self.save_json("replit_profile.json", self.replit_profile)
-            packs["replit"] = json.dumps(self.replit_profile, indent=2, default=str)
+            # Serialize once; the same JSON is reused in the howto and
+            # dossier prompts instead of re-dumping the profile per call.
+            self._replit_profile_json = orjson.dumps(self.replit_profile, option=orjson.OPT_INDENT_2, default=str).decode()
+            packs["replit"] = self._replit_profile_json
             self.console.print(f"  is_replit={self.replit_profile.get('is_replit')}, "
                                f"secrets={len(self.replit_profile.get('required_secrets', []))}, "
                                f"port={self.replit_profile.get('port_binding', {})}")
 
+        operate = None
         if self.no_llm:
             self.console.print("[bold]Step 4: Building deterministic howto (--no-llm)...[/bold]")
             howto = self._build_deterministic_howto()
@@ -110,7 +305,19 @@ class Analyzer:
             claims = self._build_deterministic_claims(howto, file_index)
         else:
             self.console.print("[bold]Step 4: Extracting how-to...[/bold]")
-            howto = await self.extract_howto(packs)
+            # generate_dossier embeds the howto JSON in its prompt, so the two
+            # LLM calls are inherently sequential. The howto round trip is
+            # instead overlapped with the deterministic operate.json build,
+            # which depends on no LLM output.
+            howto_task = asyncio.create_task(self.extract_howto(packs))
+            operate = await asyncio.to_thread(
+                build_operate,
+                repo_dir=self.repo_dir,
+                file_index=file_index,
+                mode=self.mode,
+                replit_profile=self.replit_profile,
+            )
+            howto = await howto_task
             howto = self._normalize_howto_evidence(howto)
             howto["completeness"] = self._compute_completeness(howto)
 
@@ -120,6 +327,10 @@ class Analyzer:
 
         # Add metadata to howto for schema compliance
         howto = self._add_howto_metadata(howto)
+
+        # Evidence verification is done; drop cached file lines and hashes.
+        self._line_cache.clear()
+        self._snippet_hash_cache.clear()
         
         self.save_json("index.json", file_index)
         self.save_json_with_validation("target_howto.json", howto, validate_target_howto_json)
@@ -143,16 +354,16 @@ class Analyzer:
             }
         })
 
-        with open(self.output_dir / "DOSSIER.md", "w") as f:
-            f.write(dossier)
+        (self.output_dir / "DOSSIER.md").write_text(dossier, encoding='utf-8', newline='\n')
 
         self.console.print("[bold]Step 5b: Building operate.json...[/bold]")
-        operate = build_operate(
-            repo_dir=self.repo_dir,
-            file_index=file_index,
-            mode=self.mode,
-            replit_profile=self.replit_profile,
-        )
+        if operate is None:
+            operate = build_operate(
+                repo_dir=self.repo_dir,
+                file_index=file_index,
+                mode=self.mode,
+                replit_profile=self.replit_profile,
+            )
         op_errors = validate_operate(operate)
         if op_errors:
             self.console.print(f"  [yellow]operate.json validation warnings: {len(op_errors)}[/yellow]")
@@ -204,24 +415,43 @@ class Analyzer:
         self.console.print("[bold green]All outputs written.[/bold green]")
 
     def index_files(self) -> List[str]:
-        skip_dirs = {".git", "node_modules", "__pycache__", ".pythonlibs", ".cache",
-                     ".local", ".config", "out", ".upm", ".replit_agent"}
-        skip_extensions = {".lock", ".png", ".jpg", ".jpeg", ".gif", ".ico",
-                           ".woff", ".woff2", ".ttf", ".eot", ".map"}
         file_list = []
         self._skipped_count = 0
-        for root, dirs, files in os.walk(self.repo_dir):
-            dirs[:] = [d for d in dirs if d not in skip_dirs]
-            rel_root = os.path.relpath(root, self.repo_dir)
-            if any(rel_root == sp or rel_root.startswith(sp + os.sep) for sp in self._self_skip_paths):
-                self._skipped_count += len(files)
+        self_skip_exact = set(self._self_skip_paths)
+        self_skip_prefixes = tuple(sp + os.sep for sp in self._self_skip_paths)
+        # Explicit DFS over scandir handles: DirEntry caches type info from the
+        # directory read, so we avoid the per-file stat/relpath/splitext calls
+        # that os.walk-based traversal paid on large trees.
+        stack = [(str(self.repo_dir), "", False)]
+        while stack:
+            abs_dir, rel_dir, in_self_skip = stack.pop()
+            try:
+                it = os.scandir(abs_dir)
+            except OSError:
                 continue
-            for file in files:
-                ext = os.path.splitext(file)[1]
-                if ext in skip_extensions:
-                    continue
-                rel_path = os.path.relpath(os.path.join(root, file), self.repo_dir)
-                file_list.append(rel_path)
+            with it:
+                for entry in it:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if name in _SKIP_DIRS:
+                            continue
+                        sub_rel = f"{rel_dir}{os.sep}{name}" if rel_dir else name
+                        sub_skip = in_self_skip or sub_rel in self_skip_exact or (
+                            self_skip_prefixes and sub_rel.startswith(self_skip_prefixes)
+                        )
+                        stack.append((entry.path, sub_rel, sub_skip))
+                    elif entry.is_file(follow_symlinks=False):
+                        if in_self_skip:
+                            self._skipped_count += 1
+                            continue
+                        dot = name.rfind(".")
+                        if dot > 0 and name[dot:] in _SKIP_EXTENSIONS:
+                            continue
+                        file_list.append(f"{rel_dir}{os.sep}{name}" if rel_dir else name)
         return file_list
 
     def create_evidence_packs(self, file_index: List[str]) -> Dict[str, str]:
@@ -233,46 +463,61 @@ class Analyzer:
         }
 
         for f in file_index:
-            lower = f.lower()
-            if "readme" in lower or ".md" in lower or "doc" in lower or "changelog" in lower:
+            if _DOC_RE.search(f):
                 packs["docs"].append(f)
-            elif any(cfg in lower for cfg in [
-                "package.json", "requirements.txt", "pyproject.toml", "cargo.toml",
-                "docker", ".env", "config", ".replit", "replit.nix", "makefile",
-                "taskfile", ".github/workflows", "tsconfig", "vite.config",
-            ]):
+            elif _CFG_RE.search(f):
                 packs["config"].append(f)
-            elif any(ops in lower for ops in [
-                "dockerfile", "docker-compose", ".github", "ci", "deploy", "k8s", "helm",
-            ]):
+            elif _OPS_RE.search(f):
                 packs["ops"].append(f)
-            elif any(ext in lower for ext in [
-                ".ts", ".js", ".py", ".go", ".rs", ".java", ".rb", ".tsx", ".jsx",
-            ]):
-                packs["code"].append(f)
+            else:
+                dot = f.rfind(".")
+                if dot > 0 and f[dot:].lower() in _CODE_EXTS:
+                    packs["code"].append(f)
 
         evidence = {}
-        for category, files in packs.items():
-            content = ""
-            limit = 30 if category == "config" else 20
-            for f in files[:limit]:
-                try:
-                    text = (self.repo_dir / f).read_text(errors='ignore')
-                    lines = text.splitlines()
-                    line_limit = 300 if category == "config" else 500
-                    numbered_lines = "\n".join(
-                        [f"L{i+1}: {line}" for i, line in enumerate(lines[:line_limit])]
-                    )
-                    content += f"\n--- FILE: {f} ---\n{numbered_lines}\n"
-                except Exception:
-                    pass
-
-            pack_content = content[:100000]
-            evidence[category] = pack_content
-            (self.packs_dir / f"{category}_pack.txt").write_text(pack_content)
+        # File reads are I/O-bound and independent, so fan them out across a
+        # thread pool; map() preserves input order for deterministic packs.
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for category, files in packs.items():
+                limit = 30 if category == "config" else 20
+                line_limit = 300 if category == "config" else 500
+                # Join once: string += in a loop is quadratic in pack size.
+                # Accumulation stops at the cap so blocks past it are never
+                # joined only to be sliced away.
+                parts = []
+                total = 0
+                for b in pool.map(
+                    lambda f, n=line_limit: self._read_pack_block(f, n),
+                    files[:limit],
+                ):
+                    if not b:
+                        continue
+                    parts.append(b)
+                    total += len(b)
+                    if total >= 100000:
+                        break
+                pack_content = "".join(parts)[:100000]
+                evidence[category] = pack_content
+                (self.packs_dir / f"{category}_pack.txt").write_text(pack_content, encoding='utf-8', newline='\n')
 
         return evidence
 
+    def _read_pack_block(self, f: str, line_limit: int) -> Optional[str]:
+        try:
+            # Iterate lines from the raw handle and stop at the limit
+            # so multi-MB files are neither fully read nor decoded.
+            with open(os.path.join(self._repo_dir_str, f), 'rb') as fh:
+                lines = [
+                    raw.decode('utf-8', errors='ignore').rstrip('\r\n')
+                    for raw in itertools.islice(fh, line_limit)
+                ]
+            numbered_lines = "\n".join(
+                f"L{i}: {line}" for i, line in enumerate(lines, 1)
+            )
+            return f"\n--- FILE: {f} ---\n{numbered_lines}\n"
+        except Exception:
+            return None
+
     MAX_FILE_SIZE = 2 * 1024 * 1024
     MAX_SNIPPET_LINES = 50
     BINARY_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".ico", ".woff", ".woff2",
@@ -313,7 +558,7 @@ class Analyzer:
     def _parse_evidence_string(self, ev_str: str) -> Optional[dict]:
         if not isinstance(ev_str, str):
             return ev_str if isinstance(ev_str, dict) else None
-        m = re.match(r'^([^:]+):(\d+)(?:-(\d+))?', ev_str.strip())
+        m = _EVIDENCE_RE.match(ev_str.strip())
         if not m:
             return None
         path = m.group(1)
@@ -326,30 +571,66 @@ class Analyzer:
             return None
         return make_evidence(path, line_start, line_end, snippet)
 
+    LINE_CACHE_MAX = 256
+
+    def _get_file_lines(self, path: str) -> Optional[List[str]]:
+        """Read and split a repo file, caching per path.
+
+        Claims typically cite the same handful of files many times; the cache
+        turns the per-evidence read+split into a single read per unique file.
+        Unreadable/binary results are cached too so repeated bad citations
+        stay cheap. Bounded LRU to avoid unbounded memory on giant repos.
+
+        Entries carry the file's (mtime_ns, size) signature, revalidated with
+        a stat on each hit — far cheaper than the read it replaces — so a
+        file modified while the analyzer is alive never serves stale lines.
+        """
+        filepath = self._safe_resolve_path(path)
+        sig = None
+        if filepath is not None:
+            try:
+                st = filepath.stat()
+                sig = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                filepath = None
+        cached = self._line_cache.get(path)
+        if cached is not None:
+            cached_sig, lines = cached
+            if cached_sig == sig:
+                self._line_cache.move_to_end(path)
+                return lines
+            # Stale entry: any snippet hashes derived from it are stale too.
+            self._snippet_hash_cache = {
+                k: v for k, v in self._snippet_hash_cache.items() if k[0] != path
+            }
+        lines = None
+        if filepath is not None:
+            try:
+                raw = filepath.read_bytes()
+                if b'\x00' not in raw[:4096]:
+                    lines = raw.decode("utf-8", errors="ignore").splitlines()
+            except Exception:
+                lines = None
+        self._line_cache[path] = (sig, lines)
+        if len(self._line_cache) > self.LINE_CACHE_MAX:
+            self._line_cache.popitem(last=False)
+        return lines
+
     def _read_lines_from_repo(self, path: str, line_start: int, line_end: int = 0) -> Optional[str]:
         if line_end < line_start:
             line_end = line_start
-        filepath = self._safe_resolve_path(path)
-        if filepath is None:
+        lines = self._get_file_lines(path)
+        if lines is None:
             return None
-        try:
-            raw = filepath.read_bytes()
-            if b'\x00' in raw[:4096]:
-                return None
-            content = raw.decode("utf-8", errors="ignore")
-            lines = content.splitlines()
-            if line_start < 1 or line_start > len(lines):
-                return None
-            clamped_end = min(line_end, len(lines))
-            selected = lines[line_start - 1 : clamped_end]
-            # Whitespace policy: lines are stripped (trimmed) before hashing.
-            # This normalizes indentation differences and reduces noise in
-            # evidence verification. Both make_evidence() and _verify_single_evidence()
-            # use this same canonicalization, ensuring hash consistency.
-            return "\n".join(line.strip() for line in selected)
-        except Exception:
-            pass
-        return None
+        if line_start < 1 or line_start > len(lines):
+            return None
+        clamped_end = min(line_end, len(lines))
+        selected = lines[line_start - 1 : clamped_end]
+        # Whitespace policy: lines are stripped (trimmed) before hashing.
+        # This normalizes indentation differences and reduces noise in
+        # evidence verification. Both make_evidence() and _verify_single_evidence()
+        # use this same canonicalization, ensuring hash consistency.
+        return "\n".join(line.strip() for line in selected)
 
     def _read_line_from_repo(self, path: str, line_num: int) -> Optional[str]:
         return self._read_lines_from_repo(path, line_num, line_num)
@@ -409,12 +690,9 @@ class Analyzer:
                 path = ev.get("path", "")
                 line_start = ev.get("line_start", 0)
                 if path and line_start > 0:
-                    snippet = self._read_line_from_repo(path, line_start)
-                    if snippet is not None:
-                        correct_hash = hashlib.sha256(
-                            snippet.encode("utf-8", errors="ignore")
-                        ).hexdigest()[:12]
-                        ev["snippet_hash"] = correct_hash
+                    computed = self._snippet_hash_at(path, line_start, line_start)
+                    if computed is not None:
+                        ev["snippet_hash"] = computed
                         ev["snippet_hash_verified"] = True
                     else:
                         ev["snippet_hash_verified"] = False
@@ -436,6 +714,25 @@ class Analyzer:
         claims_data["claims"] = claims
         return claims_data
 
+    def _snippet_hash_at(self, path: str, line_start: int, line_end: int) -> Optional[str]:
+        """Compute (and memoize) the snippet hash for an evidence anchor.
+
+        Claims repeatedly cite the same file:line anchors; once the line
+        cache makes reads cheap, the encode+hash becomes the remaining
+        per-evidence cost, so hashes are memoized per (path, start, end)
+        for the lifetime of the verification phase.
+        """
+        key = (path, line_start, line_end)
+        cached = self._snippet_hash_cache.get(key)
+        if cached is not None:
+            return cached
+        snippet = self._read_lines_from_repo(path, line_start, line_end)
+        if snippet is None:
+            return None
+        computed = snippet_hash_12(snippet)
+        self._snippet_hash_cache[key] = computed
+        return computed
+
     def _verify_single_evidence(self, ev: dict) -> bool:
         path = ev.get("path", "")
         line_start = ev.get("line_start", 0)
@@ -443,13 +740,9 @@ class Analyzer:
         claimed_hash = ev.get("snippet_hash", "")
         if not path or line_start <= 0 or not claimed_hash:
             return False
-        snippet = self._read_lines_from_repo(path, line_start, line_end)
-        if snippet is None:
-            return False
-        actual_hash = hashlib.sha256(
-            snippet.encode("utf-8", errors="ignore")
-        ).hexdigest()[:12]
-        return actual_hash == claimed_hash
+        if line_end < line_start:
+            line_end = line_start
+        return self._snippet_hash_at(path, line_start, line_end) == claimed_hash
 
     def _compute_completeness(self, howto: dict) -> dict:
         score = 0
@@ -460,7 +753,7 @@ class Analyzer:
             if not isinstance(ev, dict):
                 return False
             if ev.get("kind") == "file_exists":
-                return (Path(self.repo_dir) / ev.get("path", "")).exists()
+                return os.path.exists(os.path.join(self._repo_dir_str, ev.get("path", "")))
             if ev.get("snippet_hash_verified") is True:
                 return True
             if ev.get("snippet_hash") and self._verify_single_evidence(ev):
@@ -561,7 +854,7 @@ class Analyzer:
             deductions.append(f"-{penalty} for {len(unknowns)} unknown(s)")
 
         notes_parts = list(deductions)
-        if not (Path(self.repo_dir) / "Dockerfile").exists():
+        if not os.path.exists(os.path.join(self._repo_dir_str, "Dockerfile")):
             notes_parts.append("No Dockerfile found")
         if unknowns:
             notes_parts.append(f"{len(unknowns)} unknown(s) reported")
@@ -574,74 +867,66 @@ class Analyzer:
             "notes": "; ".join(notes_parts) if notes_parts else None
         }
 
-    async def extract_howto(self, packs: Dict[str, str]) -> Dict[str, Any]:
-        replit_context = ""
-        if self.mode == "replit" and self.replit_profile:
-            replit_context = f"""
-IMPORTANT: This is a Replit workspace. You MUST include a "replit_execution_profile" key in your JSON output.
-
-The Replit profiler detected the following (use this as evidence):
-{json.dumps(self.replit_profile, indent=2, default=str)}
+    async def _chat_create(self, **kwargs):
+        """Issue a chat completion under the shared concurrency cap.
 
-The "replit_execution_profile" must contain:
-- "run_command": string (from .replit file, cite .replit:<line>)
-- "language": string
-- "port_binding": object with port, binds_all_interfaces, uses_env_port, evidence array
-- "required_secrets": array of {{"name": "VAR_NAME", "referenced_in": ["file:line"]}}
-- "external_apis": array of {{"api": "name", "evidence_files": ["file"]}}
-- "deployment_assumptions": array of strings
-- "observability": object with logging, health_endpoint, evidence array
-- "limitations": array of strings (things that could not be determined)
-
-Every field must cite evidence. If no evidence exists, set value to null and add to "unknowns".
-Do NOT invent information. If a field cannot be determined, mark it unknown.
-Cap confidence at 0.20 for any claim without direct file:line evidence.
-"""
+        Rate-limit errors are retried with exponential backoff; all other
+        errors propagate to the call site's own handler.
+        """
+        import openai
 
-        prompt = f"""You are an expert system operator. Analyze the provided evidence to extract a JSON 'Operator Manual' for the target system.
+        async with self._sem:
+            for attempt in range(4):
+                try:
+                    return await self.client.chat.completions.create(**kwargs)
+                except openai.RateLimitError:
+                    if attempt == 3:
+                        raise
+                    await asyncio.sleep(2 ** attempt)
 
-Output this exact JSON schema:
-{{
-    "prereqs": ["list of tools/runtimes needed"],
-    "install_steps": [{{"step": "description", "command": "command or null", "evidence": "file:line or null"}}],
-    "config": [{{"name": "env var or config file", "purpose": "what it does", "evidence": "file:line reference"}}],
-    "run_dev": [{{"step": "description", "command": "command", "evidence": "file:line reference"}}],
-    "run_prod": [{{"step": "description", "command": "command or unknown", "evidence": "file:line reference or null"}}],
-    "usage_examples": [{{"description": "what it does", "command": "example command or API call"}}],
-    "verification_steps": [{{"step": "description", "command": "command", "evidence": "file:line reference"}}],
-    "common_failures": [{{"symptom": "what happens", "cause": "why", "fix": "how to fix"}}],
-    "unknowns": [{{"what_is_missing": "description", "why_it_matters": "impact", "what_evidence_needed": "specific evidence"}}],
-    "missing_evidence_requests": ["list of things that could not be verified"]
-}}
-{replit_context}
+    @staticmethod
+    async def _collect_stream(stream) -> str:
+        """Accumulate a streamed completion into its full text.
 
-RULES:
-- Every claim MUST cite evidence as file:line.
-- If you cannot cite evidence, mark as unknown and add to "unknowns" AND "missing_evidence_requests".
-- Do NOT invent instructions or steps that are not supported by the provided evidence.
-- If a how-to step has no evidence, set confidence to 0.20 or lower.
-"""
+        Streaming lets token accumulation start as soon as the first chunk
+        arrives instead of waiting for the full 8-16K token completion, and
+        keeps the event loop responsive during long generations.
+        """
+        parts = []
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta
+                if delta and delta.content:
+                    parts.append(delta.content)
+        return "".join(parts)
 
+    async def extract_howto(self, packs: Dict[str, str]) -> Dict[str, Any]:
         user_content = (
-            f"DOCS:\n{packs.get('docs', '')[:40000]}\n\n"
-            f"CONFIG:\n{packs.get('config', '')[:40000]}\n\n"
-            f"OPS:\n{packs.get('ops', '')[:20000]}"
+            f"DOCS:\n{_clip(packs.get('docs', ''), 10000)}\n\n"
+            f"CONFIG:\n{_clip(packs.get('config', ''), 10000)}\n\n"
+            f"OPS:\n{_clip(packs.get('ops', ''), 5000)}"
         )
 
         if "replit" in packs:
-            user_content += f"\n\nREPLIT PROFILE:\n{packs['replit'][:20000]}"
+            user_content += f"\n\nREPLIT PROFILE:\n{_clip(packs['replit'], 5000)}"
+
+        if self.mode == "replit" and self._replit_profile_json:
+            user_content += HOWTO_REPLIT_CONTEXT_TEMPLATE.format(
+                profile_json=self._replit_profile_json
+            )
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self._chat_create(
                 model="gpt-4.1",
                 messages=[
-                    {"role": "system", "content": prompt},
+                    {"role": "system", "content": HOWTO_SYSTEM_PROMPT},
                     {"role": "user", "content": user_content}
                 ],
-                response_format={"type": "json_object"},
+                response_format=_JSON_RESPONSE_FORMAT,
                 max_completion_tokens=8192,
+                stream=True,
             )
-            return json.loads(response.choices[0].message.content)
+            return orjson.loads(await self._collect_stream(response))
         except Exception as e:
             self.console.print(f"[red]Error extracting howto:[/red] {e}")
             return {
@@ -649,75 +934,95 @@ RULES:
                 "unknowns": [{"what_is_missing": "Full how-to extraction failed", "why_it_matters": "No operator manual available", "what_evidence_needed": "Retry or check API key"}],
             }
 
-    async def generate_dossier(self, packs: Dict[str, str], howto: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
-        replit_section = ""
-        if self.mode == "replit" and self.replit_profile:
-            replit_section = """
-10. **Replit Execution Profile**
-    Include ALL of the following subsections with evidence citations (file:line):
-    - Run command (from .replit)
-    - Language/runtime
-    - Port binding (port number, 0.0.0.0 binding, env PORT usage)
-    - Required secrets (names only, NEVER values, cite file:line where each is referenced)
-    - External APIs referenced (with evidence files)
-    - Nix packages required (from replit.nix)
-    - Deployment assumptions
-    - Observability/logging (present or absent, cite evidence)
-    - Limitations (what could NOT be determined)
-"""
+    @classmethod
+    async def extract_howto_batch(cls, client, packs_list: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Extract operator manuals for several targets in one LLM round-trip.
 
-        prompt = f"""You are the 'Program Totality Analyzer'. Write a Markdown DOSSIER about this target system based on static artifacts only.
+        Sending N evidence bundles in a single request amortizes the system
+        prompt across all targets instead of resending it per analysis.
+        Bundles are delimited as <<#i>> and the model returns an indexed
+        {"results": [...]} array; results[i] corresponds to packs_list[i].
+        Missing or malformed entries come back as error dicts so callers can
+        fall back to per-target extraction.
+        """
+        if not packs_list:
+            return []
+
+        n = len(packs_list)
+        sections = []
+        for i, packs in enumerate(packs_list):
+            sections.append(
+                f"<<#{i}>>\n"
+                f"DOCS:\n{_clip(packs.get('docs', ''), 5000)}\n\n"
+                f"CONFIG:\n{_clip(packs.get('config', ''), 5000)}\n\n"
+                f"OPS:\n{_clip(packs.get('ops', ''), 2500)}"
+            )
 
-SCOPE LIMITATION: This dossier is derived from static source artifacts (code, config, lockfiles). It does NOT observe runtime behavior, prove correctness, or certify security. Every claim must be labeled with its epistemic status.
+        batch_instructions = (
+            f"You will receive {n} evidence bundles labeled <<#0>> through <<#{n - 1}>>, "
+            "one per target system. Return a JSON object "
+            '{"results": [...]} where results[i] is the Operator Manual JSON '
+            f"(exactly the schema above) for bundle <<#{{i}}>>. The array must have {n} entries."
+        )
+        user_content = batch_instructions + "\n\n" + "\n\n".join(sections)
 
-MANDATORY SECTIONS:
-1. **Identity of Target System** (What is it? What is it NOT?)
-2. **Purpose & Jobs-to-be-done**
-3. **Capability Map**
-4. **Architecture Snapshot**
-5. **How to Use the Target System** (Operator manual - refine the provided howto JSON into readable, actionable steps with evidence citations)
-6. **Integration Surface** (APIs, webhooks, SDKs, data formats)
-7. **Data & Security Posture** (Storage, encryption, auth, secret handling)
-8. **Operational Reality** (What it takes to keep running)
-9. **Maintainability & Change Risk**
-{replit_section}
-11. **Unknowns / Missing Evidence** (What could NOT be determined - be specific)
-12. **Receipts** (Evidence index: list every file:line citation used above)
+        def _error_result(msg: str) -> Dict[str, Any]:
+            return {
+                "error": msg,
+                "unknowns": [{"what_is_missing": "Batch how-to extraction failed", "why_it_matters": "No operator manual available", "what_evidence_needed": "Retry per-target or check API key"}],
+            }
 
-RULES:
-- Every claim MUST cite evidence as (file:line) inline, pointing to actual source files in the target project.
-- If no evidence exists for a claim, say "UNKNOWN — evidence needed: <describe>" and add to Unknowns section.
-- Label each claim: VERIFIED (hash-anchored to source), INFERRED (derived from context but not hash-verified), or UNKNOWN.
-- Do NOT hallucinate file paths or line numbers. Do NOT use vague adjectives. Be specific and operational.
-- Do NOT cite PTA-generated output (dossier text, claims.json, evidence_pack) as evidence for claims. Evidence must reference the target system's own artifacts.
-- The "How to Use" section must read like an actual operator manual with concrete commands.
-- For Replit projects: the Replit Execution Profile section is MANDATORY.
-- All secrets must be referenced by NAME only, never expose values.
-"""
+        try:
+            response = await client.chat.completions.create(
+                model="gpt-4.1",
+                messages=[
+                    {"role": "system", "content": HOWTO_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_content}
+                ],
+                response_format=_JSON_RESPONSE_FORMAT,
+                max_completion_tokens=16384,
+            )
+            data = orjson.loads(response.choices[0].message.content)
+        except Exception as e:
+            return [_error_result(str(e)) for _ in packs_list]
+
+        results = data.get("results", [])
+        if not isinstance(results, list):
+            return [_error_result("batch response missing results array") for _ in packs_list]
+        return [
+            results[i] if i < len(results) and isinstance(results[i], dict)
+            else _error_result(f"batch result {i} missing or malformed")
+            for i in range(n)
+        ]
 
-        howto_str = json.dumps(howto, indent=2, default=str)
+    async def generate_dossier(self, packs: Dict[str, str], howto: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
+        howto_str = orjson.dumps(howto, option=orjson.OPT_INDENT_2, default=str).decode()
         replit_str = ""
-        if self.replit_profile:
-            replit_str = f"\n\nREPLIT PROFILE (detected by static analysis):\n{json.dumps(self.replit_profile, indent=2, default=str)}"
+        if self._replit_profile_json:
+            replit_str = f"\n\nREPLIT PROFILE (detected by static analysis):\n{self._replit_profile_json}"
 
         user_content = (
             f"HOWTO JSON:\n{howto_str}\n\n"
-            f"DOCS:\n{packs.get('docs', '')[:30000]}\n\n"
-            f"CONFIG:\n{packs.get('config', '')[:30000]}\n\n"
-            f"CODE SNAPSHOT:\n{packs.get('code', '')[:40000]}"
+            f"DOCS:\n{_clip(packs.get('docs', ''), 7500)}\n\n"
+            f"CONFIG:\n{_clip(packs.get('config', ''), 7500)}\n\n"
+            f"CODE SNAPSHOT:\n{_clip(packs.get('code', ''), 10000)}"
             f"{replit_str}"
         )
 
+        if self.mode == "replit" and self.replit_profile:
+            user_content += DOSSIER_REPLIT_SECTION
+
         try:
-            response = self.client.chat.completions.create(
+            response = await self._chat_create(
                 model="gpt-4.1",
                 messages=[
-                    {"role": "system", "content": prompt},
+                    {"role": "system", "content": DOSSIER_SYSTEM_PROMPT},
                     {"role": "user", "content": user_content}
                 ],
                 max_completion_tokens=8192,
+                stream=True,
             )
-            dossier = response.choices[0].message.content
+            dossier = await self._collect_stream(response)
 
             claims = await self._extract_claims(dossier, packs)
 
@@ -732,76 +1037,61 @@ RULES:
             return None
         for attempt in range(5):
             try:
-                return json.loads(raw)
-            except json.JSONDecodeError:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
                 pass
-            raw = re.sub(r',\s*$', '', raw.rstrip())
-            open_braces = raw.count("{") - raw.count("}")
-            open_brackets = raw.count("[") - raw.count("]")
+            raw = _TRAILING_COMMA_RE.sub('', raw.rstrip())
+            # Single pass: track string/escape state while balancing, instead
+            # of four count() scans plus a separate quote scan. Only brackets
+            # outside string literals count (braces inside quoted values no
+            # longer skew the repair), and the open-delimiter stack lets us
+            # close in correct nesting order rather than all ] before all }.
+            open_stack = []
             in_string = False
             escape = False
             for ch in raw:
                 if escape:
                     escape = False
-                    continue
-                if ch == '\\':
+                elif ch == '\\':
                     escape = True
-                    continue
-                if ch == '"':
+                elif ch == '"':
                     in_string = not in_string
-            if in_string:
-                raw += '"'
-            raw += "]" * max(0, open_brackets)
-            raw += "}" * max(0, open_braces)
+                elif not in_string:
+                    if ch == '{' or ch == '[':
+                        open_stack.append(ch)
+                    elif ch == '}' and open_stack and open_stack[-1] == '{':
+                        open_stack.pop()
+                    elif ch == ']' and open_stack and open_stack[-1] == '[':
+                        open_stack.pop()
+            raw = "".join((
+                raw,
+                '"' if in_string else '',
+                "".join('}' if c == '{' else ']' for c in reversed(open_stack)),
+            ))
         return None
 
     async def _extract_claims(self, dossier: str, packs: Dict[str, str]) -> Dict[str, Any]:
-        claims_prompt = """You are a claims extractor. Given a technical dossier and source evidence packs, extract the TOP 30 most important factual claims made in the dossier. Focus on architecture, runtime, dependencies, and security claims.
-
-For each claim output:
-{
-  "claims": [
-    {
-      "id": "claim_NNN",
-      "section": "section name from dossier",
-      "statement": "the exact claim",
-      "confidence": 0.0-1.0,
-      "evidence": [
-        {"path": "file.ext", "line_start": N, "line_end": N, "display": "file.ext:N"}
-      ],
-      "status": "evidenced | inferred | unknown"
-    }
-  ]
-}
-
-RULES:
-- Limit to 30 claims maximum, prioritizing the most important ones
-- confidence >= 0.80 only if evidence array is non-empty with valid file:line references
-- confidence capped at 0.20 for claims with empty evidence or status "unknown"
-- Do NOT fabricate snippet_hash values; the server computes them
-- Every claim must have at least one evidence entry
-- status "evidenced" = direct file:line proof; "inferred" = reasonable but indirect; "unknown" = no evidence"""
-
         user_content = (
-            f"DOSSIER:\n{dossier[:30000]}\n\n"
-            f"CONFIG EVIDENCE:\n{packs.get('config', '')[:15000]}\n\n"
-            f"CODE EVIDENCE:\n{packs.get('code', '')[:15000]}"
+            f"DOSSIER:\n{_clip(dossier, 7500)}\n\n"
+            f"CONFIG EVIDENCE:\n{_clip(packs.get('config', ''), 3750)}\n\n"
+            f"CODE EVIDENCE:\n{_clip(packs.get('code', ''), 3750)}"
         )
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self._chat_create(
                 model="gpt-4.1",
                 messages=[
-                    {"role": "system", "content": claims_prompt},
+                    {"role": "system", "content": CLAIMS_SYSTEM_PROMPT},
                     {"role": "user", "content": user_content}
                 ],
-                response_format={"type": "json_object"},
+                response_format=_JSON_RESPONSE_FORMAT,
                 max_completion_tokens=16384,
+                stream=True,
             )
-            raw = response.choices[0].message.content
+            raw = await self._collect_stream(response)
             try:
-                claims_data = json.loads(raw)
-            except json.JSONDecodeError:
+                claims_data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
                 self.console.print("[yellow]Claims JSON truncated, attempting repair...[/yellow]")
                 claims_data = self._repair_truncated_json(raw)
                 if not claims_data:
@@ -835,7 +1125,7 @@ RULES:
                     continue
                 if ev.get("kind") == "file_exists":
                     v = dict(ev)
-                    v["verified"] = (Path(self.repo_dir) / ev.get("path", "")).exists()
+                    v["verified"] = os.path.exists(os.path.join(self._repo_dir_str, ev.get("path", "")))
                     if not v["verified"]:
                         confidence = min(confidence, 0.20)
                         status = "unverified"
@@ -864,7 +1154,7 @@ RULES:
         if pkg_json.exists():
             try:
                 pkg_lines = pkg_json.read_text(errors="ignore").splitlines()
-                pkg = json.loads("\n".join(pkg_lines))
+                pkg = orjson.loads("\n".join(pkg_lines))
                 name = pkg.get("name", "")
                 if name:
                     ln = self._find_line(pkg_json, '"name"')
@@ -888,7 +1178,7 @@ RULES:
                     ln = self._find_line(pkg_json, '"dependencies"')
                     ev = make_evidence_from_line("package.json", ln, pkg_lines[ln - 1].strip()) if ln else None
                     _add("Integration Surface", f"Key dependencies: {', '.join(key_deps)}", 0.50, [ev] if ev else [])
-            except (json.JSONDecodeError, Exception):
+            except Exception:
                 pass
 
         pyproject = self.repo_dir / "pyproject.toml"
@@ -996,7 +1286,7 @@ RULES:
             howto["prereqs"].append("Node.js")
             try:
                 pkg_lines = pkg_json.read_text(errors="ignore").splitlines()
-                pkg = json.loads("\n".join(pkg_lines))
+                pkg = orjson.loads("\n".join(pkg_lines))
                 scripts = pkg.get("scripts", {})
                 if "dev" in scripts:
                     line_num = self._find_line(pkg_json, '"dev"')
@@ -1014,7 +1304,7 @@ RULES:
                     ev = make_evidence_from_line("package.json", line_num, actual_line) if line_num else None
                     howto["run_prod"].append({"step": "Start production", "command": "npm start", "evidence": ev})
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
 
             if (self.repo_dir / "package-lock.json").exists():
@@ -1129,7 +1419,7 @@ RULES:
             lines.append("")
 
         lines.append("## 3. Operator Manual (Deterministic)")
-        howto_str = json.dumps(howto, indent=2, default=str)
+        howto_str = orjson.dumps(howto, option=orjson.OPT_INDENT_2, default=str).decode()
         lines.append(f"```json\n{howto_str}\n```")
         lines.append("")
 
@@ -1155,8 +1445,10 @@ RULES:
         )
         
         try:
-            with os.fdopen(tmp_fd, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            with os.fdopen(tmp_fd, 'wb') as f:
+                # orjson serializes to bytes in C — substantially faster than
+                # stdlib json on the large index/claims/pack payloads.
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
                 f.flush()
                 os.fsync(f.fileno())
             # Atomic rename (requires same filesystem)
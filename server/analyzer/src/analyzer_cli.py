@@ -5,10 +5,8 @@ import asyncio
 from typing import Optional
 from enum import Enum
 
-from .analyzer import Analyzer
-from .pta_diff import diff_packs, save_diff
-from .core.adapter import load_evidence_pack
-from .core.render import render_report, save_report
+# The analyzer module (and its openai/gitpython/rich imports) is pulled in
+# lazily inside each command so `pta --help` stays fast.
 
 app = typer.Typer(
     help="Program Totality Analyzer - Generate static-artifact-anchored technical dossiers for software projects.",
@@ -50,6 +48,8 @@ def analyze(
     Use --no-llm for deterministic extraction without LLM dependency.
     Use --mode to select report rendering: engineer (default), auditor, or executive.
     """
+    from .analyzer import Analyzer
+
     console = Analyzer.get_console()
 
     if replit:
@@ -100,6 +100,10 @@ def diff(
     Example:
         pta diff out/run1/evidence_pack.v1.json out/run2/evidence_pack.v1.json -o ./diff_out
     """
+    from .analyzer import Analyzer
+    from .pta_diff import diff_packs, save_diff
+    from .core.adapter import load_evidence_pack
+
     console = Analyzer.get_console()
 
     from pathlib import Path
@@ -147,6 +151,10 @@ def render(
     Example:
         pta render out/evidence_pack.v1.json --mode auditor -o ./reports
     """
+    from .analyzer import Analyzer
+    from .core.adapter import load_evidence_pack
+    from .core.render import render_report, save_report
+
     console = Analyzer.get_console()
     from pathlib import Path
 
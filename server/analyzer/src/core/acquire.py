@@ -56,7 +56,13 @@ def acquire_target(
             clone_url = _inject_token_into_url(target, gh_token)
 
         try:
-            Repo.clone_from(clone_url, repo_dir)
+            # The analyzer only reads the working tree, so fetch a single
+            # commit instead of the full history.
+            Repo.clone_from(
+                clone_url,
+                repo_dir,
+                multi_options=["--depth=1", "--single-branch", "--no-tags"],
+            )
         except GitCommandError as e:
             stderr_msg = str(e)
             if "Authentication failed" in stderr_msg or "Invalid username" in stderr_msg:
@@ -12,12 +12,12 @@ Verification policy:
 All downstream rendering and diff operations consume this pack only.
 """
 
-import json
+import orjson
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
-from .verify_policy import is_verified_claim, get_verified_evidence
+from .verify_policy import verified_evidence_iter
 from ..version import TOOL_VERSION
 
 
@@ -80,8 +80,20 @@ def build_evidence_pack(
     Only claims passing verify_policy.is_verified_claim() are included.
     Claims are grouped by their extractor-assigned section.
     """
+    claim_list = _get_claims_list(claims)
     verified_claims = _get_verified_claims(claims)
 
+    # One pass over known_unknowns covers both the summary counts and the
+    # unknowns-coverage metric.
+    unknown_categories = 0
+    verified_categories = 0
+    for u in known_unknowns:
+        status = u.get("status")
+        if status == "UNKNOWN":
+            unknown_categories += 1
+        elif status == "VERIFIED":
+            verified_categories += 1
+
     total_files_seen = len(file_index) + skipped_files
 
     pack: Dict[str, Any] = {
@@ -93,22 +105,16 @@ def build_evidence_pack(
         "verified": _group_by_section(verified_claims),
         "verified_structural": _build_verified_structural(verified_claims, howto, file_index),
         "unknowns": known_unknowns,
-        "metrics": _build_metrics(howto, claims, known_unknowns, coverage),
+        "metrics": _build_metrics(howto, claim_list, verified_claims, len(known_unknowns), verified_categories, coverage),
         "hashes": {
             "snippets": _collect_snippet_hashes(claims, howto),
         },
         "summary": {
             "total_files": len(file_index),
-            "total_claims": len(_get_claims_list(claims)),
+            "total_claims": len(claim_list),
             "verified_claims": len(verified_claims),
-            "unknown_categories": len([
-                u for u in known_unknowns
-                if u.get("status") == "UNKNOWN"
-            ]),
-            "verified_categories": len([
-                u for u in known_unknowns
-                if u.get("status") == "VERIFIED"
-            ]),
+            "unknown_categories": unknown_categories,
+            "verified_categories": verified_categories,
         },
         "coverage": {
             "analyzed_files": len(file_index),
@@ -139,14 +145,14 @@ def save_evidence_pack(pack: Dict[str, Any], output_dir: Path) -> Path:
             + "\n".join(f"  - {e}" for e in errors)
         )
     path = output_dir / "evidence_pack.v1.json"
-    with open(path, "w") as f:
-        json.dump(pack, f, indent=2, default=str)
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(pack, option=orjson.OPT_INDENT_2, default=str))
     return path
 
 
 def load_evidence_pack(path: Path) -> Dict[str, Any]:
-    with open(path) as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def _get_claims_list(claims: Dict[str, Any]) -> List[Dict]:
@@ -162,12 +168,15 @@ def _get_verified_claims(claims: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     result = []
     for claim in _get_claims_list(claims):
-        if is_verified_claim(claim):
+        # One policy pass per claim: the evidence list doubles as the
+        # verification check (a claim is verified iff it is non-empty).
+        evidence = list(verified_evidence_iter(claim))
+        if evidence:
             result.append({
                 "id": claim.get("id", ""),
                 "statement": claim.get("statement", ""),
                 "section": claim.get("section", ""),
-                "evidence": get_verified_evidence(claim),
+                "evidence": evidence,
                 "confidence": claim.get("confidence", 0),
             })
     return result
@@ -228,22 +237,24 @@ def _build_verified_structural(
 
 def _build_metrics(
     howto: Dict[str, Any],
-    claims: Dict[str, Any],
-    known_unknowns: List[Dict[str, Any]],
+    claim_list: List[Dict[str, Any]],
+    verified_claims: List[Dict[str, Any]],
+    total_categories: int,
+    verified_categories: int,
     coverage: Dict[str, Any],
 ) -> Dict[str, Any]:
     """
     Build metrics namespace with clear separation:
       - rci: Reporting Completeness Index (composite maturity)
       - dci_v1_claims_visibility: claims-only visibility ratio
+
+    Takes the already-computed claim and verified-claim lists so the
+    verification policy runs once per claim across the whole pack build.
     """
-    claim_list = _get_claims_list(claims)
     total_claims = len(claim_list)
-    verified_count = len(_get_verified_claims(claims))
+    verified_count = len(verified_claims)
     claims_coverage = (verified_count / total_claims) if total_claims > 0 else 0.0
 
-    total_categories = len(known_unknowns)
-    verified_categories = len([u for u in known_unknowns if u.get("status") == "VERIFIED"])
     unknowns_coverage = (verified_categories / total_categories) if total_categories > 0 else 0.0
 
     completeness = howto.get("completeness", {})
@@ -281,29 +292,33 @@ def _build_metrics(
     }
 
 
+_HOWTO_EVIDENCE_SECTIONS = ("install_steps", "config", "run_dev", "run_prod", "verification_steps", "common_failures")
+
+
+def _iter_evidence_hashes(ev) -> List[str]:
+    """Yield snippet hashes from an evidence field of any accepted shape."""
+    if isinstance(ev, dict):
+        h = ev.get("snippet_hash")
+        return [h] if h else []
+    if isinstance(ev, list):
+        return [e["snippet_hash"] for e in ev if isinstance(e, dict) and e.get("snippet_hash")]
+    return []
+
+
 def _collect_snippet_hashes(claims: Dict[str, Any], howto: Dict[str, Any]) -> List[str]:
-    hashes = set()
+    hashes: set = set()
 
     for claim in _get_claims_list(claims):
-        for ev in claim.get("evidence", []):
-            if isinstance(ev, dict):
-                h = ev.get("snippet_hash", "")
-                if h:
-                    hashes.add(h)
+        hashes.update(_iter_evidence_hashes(claim.get("evidence", [])))
 
-    for section in ["install_steps", "config", "run_dev", "run_prod", "verification_steps", "common_failures"]:
+    for section in _HOWTO_EVIDENCE_SECTIONS:
         items = howto.get(section, [])
         if isinstance(items, dict):
             items = [items]
         if isinstance(items, list):
             for item in items:
                 if isinstance(item, dict):
-                    ev = item.get("evidence")
-                    if isinstance(ev, dict) and ev.get("snippet_hash"):
-                        hashes.add(ev["snippet_hash"])
-                    elif isinstance(ev, list):
-                        for e in ev:
-                            if isinstance(e, dict) and e.get("snippet_hash"):
-                                hashes.add(e["snippet_hash"])
+                    hashes.update(_iter_evidence_hashes(item.get("evidence")))
 
+    # Sorted for deterministic packs and stable diffs.
     return sorted(hashes)
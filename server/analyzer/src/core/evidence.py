@@ -1,9 +1,27 @@
 import hashlib
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional, List
 
+# Copying a pre-initialized digest skips hashlib's per-call constructor
+# overhead, which matters on the many short snippets we hash. SHA-256 itself
+# is kept: the truncated hex digest is part of the evidence contract and must
+# match hashes already stored in packs and claims.
+_SHA256_BASE = hashlib.sha256()
 
-@dataclass
+
+def snippet_hash_12(text: str) -> str:
+    """Canonical 12-hex-char snippet hash used across all evidence producers."""
+    return snippet_hash_12_bytes(text.encode("utf-8", errors="ignore"))
+
+
+def snippet_hash_12_bytes(data: bytes) -> str:
+    """Hash an already-encoded snippet, skipping the str->bytes round trip."""
+    h = _SHA256_BASE.copy()
+    h.update(data)
+    return h.hexdigest()[:12]
+
+
+@dataclass(slots=True, frozen=True)
 class Evidence:
     path: str
     line_start: int
@@ -12,25 +30,46 @@ class Evidence:
     display: str
 
     def to_dict(self):
-        return asdict(self)
+        # Flat record: a dict literal avoids asdict's recursive walk.
+        return {
+            "path": self.path,
+            "line_start": self.line_start,
+            "line_end": self.line_end,
+            "snippet_hash": self.snippet_hash,
+            "display": self.display,
+        }
+
+
+def _evidence_dict(path: str, line_start: int, line_end: int, snippet_hash: str) -> dict:
+    display = f"{path}:{line_start}" if line_start == line_end else f"{path}:{line_start}-{line_end}"
+    return {
+        "path": path,
+        "line_start": line_start,
+        "line_end": line_end,
+        "snippet_hash": snippet_hash,
+        "display": display,
+    }
 
 
 def make_evidence(path: str, line_start: int, line_end: int, snippet: str) -> dict:
     if line_start < 1 or line_end < 1:
         return None
-    snippet_hash = hashlib.sha256(snippet.encode("utf-8", errors="ignore")).hexdigest()[:12]
-    display = f"{path}:{line_start}" if line_start == line_end else f"{path}:{line_start}-{line_end}"
-    return Evidence(
-        path=path,
-        line_start=line_start,
-        line_end=line_end,
-        snippet_hash=snippet_hash,
-        display=display,
-    ).to_dict()
+    return _evidence_dict(path, line_start, line_end, snippet_hash_12(snippet))
+
+
+def make_evidence_bytes(path: str, line_start: int, line_end: int, snippet_bytes: bytes) -> dict:
+    """make_evidence variant for producers that already hold encoded bytes.
+
+    Skips the encode round trip for callers reading snippets straight from
+    disk; hashes are identical to make_evidence on the UTF-8 decoded text.
+    """
+    if line_start < 1 or line_end < 1:
+        return None
+    return _evidence_dict(path, line_start, line_end, snippet_hash_12_bytes(snippet_bytes))
 
 
 def make_file_exists_evidence(path: str) -> dict:
-    snippet_hash = hashlib.sha256(path.encode("utf-8")).hexdigest()[:12]
+    snippet_hash = snippet_hash_12(path)
     return {
         "kind": "file_exists",
         "path": path,
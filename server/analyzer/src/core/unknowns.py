@@ -65,6 +65,10 @@ _CATEGORY_RESOLVE_WITH = {
 }
 
 
+# Nine rules across eight categories anchor on Terraform files; they share
+# one Pattern object instead of nine identical compilations.
+_TF_RE = re.compile(r"\.tf$")
+
 _UPGRADE_RULES: Dict[str, List[Dict[str, Any]]] = {
     "tls_termination": [
         {
@@ -74,7 +78,7 @@ _UPGRADE_RULES: Dict[str, List[Dict[str, Any]]] = {
         },
         {
             "artifact": "Terraform ACM certificate",
-            "file_exact": re.compile(r"\.tf$"),
+            "file_exact": _TF_RE,
             "content_probe": "aws_acm_certificate",
         },
         {
@@ -91,12 +95,12 @@ _UPGRADE_RULES: Dict[str, List[Dict[str, Any]]] = {
     "encryption_at_rest": [
         {
             "artifact": "Terraform aws_db_instance with storage_encrypted",
-            "file_exact": re.compile(r"\.tf$"),
+            "file_exact": _TF_RE,
             "content_probe": "storage_encrypted",
         },
         {
             "artifact": "Terraform aws_rds_cluster with storage_encrypted",
-            "file_exact": re.compile(r"\.tf$"),
+            "file_exact": _TF_RE,
             "content_probe": "storage_encrypted",
         },
         {
@@ -118,7 +122,7 @@ _UPGRADE_RULES: Dict[str, List[Dict[str, Any]]] = {
         },
         {
             "artifact": "Terraform vault_generic_secret",
-            "file_exact": re.compile(r"\.tf$"),
+            "file_exact": _TF_RE,
             "content_probe": "vault_generic_secret",
         },
         {
@@ -177,7 +181,7 @@ _UPGRADE_RULES: Dict[str, List[Dict[str, Any]]] = {
         },
         {
             "artifact": "Terraform IAM role",
-            "file_exact": re.compile(r"\.tf$"),
+            "file_exact": _TF_RE,
             "content_probe": "aws_iam_role",
         },
         {
@@ -199,7 +203,7 @@ _UPGRADE_RULES: Dict[str, List[Dict[str, Any]]] = {
         },
         {
             "artifact": "Terraform CloudWatch log group",
-            "file_exact": re.compile(r"\.tf$"),
+            "file_exact": _TF_RE,
             "content_probe": "aws_cloudwatch_log_group",
         },
     ],
@@ -221,7 +225,7 @@ _UPGRADE_RULES: Dict[str, List[Dict[str, Any]]] = {
         },
         {
             "artifact": "Terraform CloudWatch alarm",
-            "file_exact": re.compile(r"\.tf$"),
+            "file_exact": _TF_RE,
             "content_probe": "aws_cloudwatch_metric_alarm",
         },
         {
@@ -233,7 +237,7 @@ _UPGRADE_RULES: Dict[str, List[Dict[str, Any]]] = {
     "backup_retention": [
         {
             "artifact": "Terraform backup plan",
-            "file_exact": re.compile(r"\.tf$"),
+            "file_exact": _TF_RE,
             "content_probe": "aws_backup_plan",
         },
         {
@@ -245,13 +249,48 @@ _UPGRADE_RULES: Dict[str, List[Dict[str, Any]]] = {
     "data_residency": [
         {
             "artifact": "Terraform provider region constraint",
-            "file_exact": re.compile(r"\.tf$"),
+            "file_exact": _TF_RE,
             "content_probe": "region",
         },
     ],
 }
 
 
+def _combine_rule_patterns(rules: List[Dict[str, Any]]) -> Optional[re.Pattern]:
+    """Fold a category's file_exact patterns into one alternation.
+
+    The advisory index scan only needs "does any rule match this path", so
+    one compiled alternation per category replaces a rules x files search
+    loop. Case sensitivity is preserved per rule via inline (?i:) groups.
+    """
+    if not rules:
+        return None
+    parts = []
+    seen = set()
+    for rule in rules:
+        p = rule["file_exact"]
+        part = f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})"
+        # Several rules in a category can share a pattern (e.g. \.tf$ with
+        # different content probes); one branch in the alternation suffices.
+        if part not in seen:
+            seen.add(part)
+            parts.append(part)
+    return re.compile("|".join(parts))
+
+
+_COMBINED_RULE_PATTERNS: Dict[str, Optional[re.Pattern]] = {
+    category: _combine_rule_patterns(rules)
+    for category, rules in _UPGRADE_RULES.items()
+}
+
+# Union of every rule pattern across all categories. Most files in a repo
+# match no category at all, so one quick-reject pass with this pattern
+# replaces nine per-category scans for the common case.
+_ANY_RULE_PATTERN: Optional[re.Pattern] = _combine_rule_patterns(
+    [rule for rules in _UPGRADE_RULES.values() for rule in rules]
+)
+
+
 def compute_known_unknowns(
     howto: Dict[str, Any],
     claims: Dict[str, Any],
@@ -277,15 +316,22 @@ def compute_known_unknowns(
     Claims are intentionally NOT consulted. Claims are LLM outputs;
     unknown resolution must come from deterministic file inspection.
     """
+    # Prefilter to files matching any rule anywhere; the per-category scans
+    # below then run over this usually tiny candidate list instead of the
+    # full index.
+    candidates = _find_artifact_files_in_index(file_index, _ANY_RULE_PATTERN)
+
     results = []
     for category in KNOWN_UNKNOWN_CATEGORIES_V1:
         status = "UNKNOWN"
         evidence_refs: List[Dict[str, Any]] = []
         notes = ""
 
-        rules = _UPGRADE_RULES.get(category, [])
-
-        artifact_files = _find_artifact_files_in_index(file_index, rules)
+        # Only the first three matches appear in the advisory note, so the
+        # scan stops as soon as it has them.
+        artifact_files = _find_artifact_files_in_index(
+            candidates, _COMBINED_RULE_PATTERNS.get(category), limit=3
+        )
         if artifact_files:
             notes = (
                 f"Candidate artifact files found ({', '.join(artifact_files[:3])}) "
@@ -307,19 +353,26 @@ def compute_known_unknowns(
 
 
 def _find_artifact_files_in_index(
-    file_index: List[str], rules: List[Dict[str, Any]]
+    file_index: List[str], pattern: Optional[re.Pattern], limit: Optional[int] = None
 ) -> List[str]:
     """
     Check if any files in the index match upgrade rule patterns.
     This is used for advisory notes only — it does NOT promote to VERIFIED.
+
+    Takes the category's combined alternation: one regex pass per file
+    replaces the old rules x files loop, and the single pass makes the
+    old seen-set dedup unnecessary. Matches come back in index order.
+    A limit stops the scan once enough matches have been collected.
     """
-    matched = []
-    seen = set()
-    for rule in rules:
-        for f in file_index:
-            if f in seen:
-                continue
-            if rule["file_exact"].search(f):
-                matched.append(f)
-                seen.add(f)
-    return matched
+    if pattern is None:
+        return []
+    search = pattern.search
+    if limit is None:
+        return [f for f in file_index if search(f)]
+    matches = []
+    for f in file_index:
+        if search(f):
+            matches.append(f)
+            if len(matches) >= limit:
+                break
+    return matches
@@ -25,6 +25,7 @@ Future tiers (not yet active):
   These are tracked but do NOT elevate a claim to VERIFIED in v1.
 """
 
+import functools
 import os
 from typing import Dict, Any, List
 
@@ -50,6 +51,9 @@ GENERATED_ARTIFACT_PATTERNS = {
 GENERATED_DIR_MARKERS = {"packs/", "out/"}
 
 
+# The same evidence paths recur across claims, sections and render passes;
+# the classification is a pure function of the path string, so cache it.
+@functools.lru_cache(maxsize=4096)
 def is_generated_artifact(path: str) -> bool:
     if not path:
         return False
@@ -91,11 +95,17 @@ def is_evidence_verified_v1(ev: dict) -> bool:
 
 
 def is_verified_claim(claim: dict) -> bool:
-    for ev in claim.get("evidence", []):
-        if is_evidence_verified_v1(ev):
-            return True
-    return False
+    return any(is_evidence_verified_v1(ev) for ev in claim.get("evidence", ()))
+
+
+def verified_evidence_iter(claim: dict):
+    """Lazily yield the claim's verified evidence items.
+
+    Callers that only need to know whether any verified evidence exists,
+    or only the first item, can stop without materializing the full list.
+    """
+    return (ev for ev in claim.get("evidence", ()) if is_evidence_verified_v1(ev))
 
 
 def get_verified_evidence(claim: dict) -> List[dict]:
-    return [ev for ev in claim.get("evidence", []) if is_evidence_verified_v1(ev)]
+    return list(verified_evidence_iter(claim))
@@ -17,7 +17,7 @@ NOT allowed:
   - Generating vulnerability claims
 """
 
-import json
+import orjson
 from pathlib import Path
 from typing import Dict, Any, List, Set
 
@@ -73,8 +73,8 @@ def save_diff(diff: Dict[str, Any], output_dir: Path) -> tuple:
     diff_json_path = output_dir / "diff.json"
     diff_report_path = output_dir / "DIFF_REPORT.md"
 
-    with open(diff_json_path, "w") as f:
-        json.dump(diff, f, indent=2, default=str)
+    with open(diff_json_path, "wb") as f:
+        f.write(orjson.dumps(diff, option=orjson.OPT_INDENT_2, default=str))
 
     report = render_diff_report(diff)
     with open(diff_report_path, "w") as f:
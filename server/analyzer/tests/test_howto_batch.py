@@ -0,0 +1,119 @@
+"""
+Tests for Analyzer.extract_howto_batch result alignment.
+
+Ensures:
+- results[i] maps back to packs_list[i] for a well-formed response
+- A short results array pads the missing tail with error dicts
+- Non-list or absent "results" yields an error dict per target
+- Non-dict entries are replaced with error dicts at their index
+- Transport and JSON-parse failures fall back to one error dict per target
+- An empty packs_list returns [] without calling the API
+"""
+import asyncio
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from server.analyzer.src.analyzer import Analyzer
+
+
+class _FakeClient:
+    """Stands in for AsyncOpenAI; returns a canned response or raises."""
+
+    def __init__(self, content=None, exc=None):
+        self.calls = 0
+
+        async def create(**kwargs):
+            self.calls += 1
+            if exc is not None:
+                raise exc
+            message = SimpleNamespace(content=content)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+
+def _batch(client, packs_list):
+    return asyncio.run(Analyzer.extract_howto_batch(client, packs_list))
+
+
+def _packs(n):
+    return [
+        {"docs": f"docs {i}", "config": f"config {i}", "ops": f"ops {i}"}
+        for i in range(n)
+    ]
+
+
+def _response(results):
+    return orjson.dumps({"results": results}).decode()
+
+
+class TestExtractHowtoBatch(unittest.TestCase):
+
+    def test_results_align_with_input_order(self):
+        manuals = [{"identity": {"name": f"target-{i}"}} for i in range(3)]
+        client = _FakeClient(content=_response(manuals))
+        results = _batch(client, _packs(3))
+        self.assertEqual(results, manuals)
+        self.assertEqual(client.calls, 1)
+
+    def test_short_results_array_pads_with_errors(self):
+        manuals = [{"identity": {"name": "target-0"}}]
+        client = _FakeClient(content=_response(manuals))
+        results = _batch(client, _packs(3))
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0], manuals[0])
+        for i in (1, 2):
+            self.assertIn("error", results[i])
+            self.assertIn("unknowns", results[i])
+
+    def test_non_list_results_errors_every_target(self):
+        client = _FakeClient(content=orjson.dumps({"results": "nope"}).decode())
+        results = _batch(client, _packs(2))
+        self.assertEqual(len(results), 2)
+        for entry in results:
+            self.assertIn("error", entry)
+
+    def test_missing_results_key_errors_every_target(self):
+        client = _FakeClient(content="{}")
+        results = _batch(client, _packs(2))
+        self.assertEqual(len(results), 2)
+        for entry in results:
+            self.assertIn("error", entry)
+
+    def test_non_dict_entries_replaced_with_errors(self):
+        manuals = [{"identity": {"name": "target-0"}}, "not a manual", 42]
+        client = _FakeClient(content=_response(manuals))
+        results = _batch(client, _packs(3))
+        self.assertEqual(results[0], manuals[0])
+        for i in (1, 2):
+            self.assertIn("error", results[i])
+
+    def test_api_failure_errors_every_target(self):
+        client = _FakeClient(exc=RuntimeError("connection reset"))
+        results = _batch(client, _packs(2))
+        self.assertEqual(len(results), 2)
+        for entry in results:
+            self.assertIn("connection reset", entry["error"])
+            self.assertIn("unknowns", entry)
+
+    def test_unparseable_response_errors_every_target(self):
+        client = _FakeClient(content="not json {")
+        results = _batch(client, _packs(2))
+        self.assertEqual(len(results), 2)
+        for entry in results:
+            self.assertIn("error", entry)
+
+    def test_empty_input_skips_api_call(self):
+        client = _FakeClient(content=_response([]))
+        self.assertEqual(_batch(client, []), [])
+        self.assertEqual(client.calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Tests for ReplitProfiler workspace detection.
+
+Ensures:
+- .replit / replit.nix parsing (run, entrypoint, language, nix packages)
+- Port binding detection (literal port, 0.0.0.0, env PORT)
+- Secret detection with one citation per env var per file
+- External API detection with the five-file evidence cap
+- Observability detection with a single workspace-wide logging marker
+- Skip dirs and minified bundles are excluded from the scan
+- Signal-less workspaces return the minimal profile without deep scans
+- detect() result is cached on the instance
+"""
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from server.analyzer.src.core.replit_profile import ReplitProfiler
+
+
+class TestReplitProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    def _write(self, rel, content):
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def _detect(self):
+        return ReplitProfiler(self.root).detect()
+
+    def test_replit_config_parsing(self):
+        self._write(".replit", 'run = "npm start"\nentrypoint = "index.js"\nlanguage = "nodejs"\n[nix]\n')
+        self._write("replit.nix", "{ deps = [ pkgs.nodejs pkgs.yarn ]; }\n")
+        profile = self._detect()
+        self.assertTrue(profile["is_replit"])
+        self.assertEqual(profile["run_command"], "npm start")
+        self.assertEqual(profile["entrypoint"], "index.js")
+        self.assertEqual(profile["language"], "nodejs")
+        self.assertEqual(profile["nix_packages"], ["nodejs", "yarn"])
+        self.assertTrue(profile["replit_file_parsed"]["has_nix_section"])
+
+    def test_port_binding_detection(self):
+        self._write("package.json", "{}")
+        self._write("server.js", 'app.listen(3000);\nserver.bind("0.0.0.0");\nconst p = process.env.PORT;\n')
+        binding = self._detect()["port_binding"]
+        self.assertEqual(binding["port"], 3000)
+        self.assertTrue(binding["binds_all_interfaces"])
+        self.assertTrue(binding["uses_env_port"])
+        self.assertEqual(len(binding["evidence"]), 3)
+
+    def test_secret_citations_dedup_per_file(self):
+        self._write("package.json", "{}")
+        self._write("a.js", "process.env.MY_KEY;\n" * 20)
+        self._write("b.js", "const x = process.env.MY_KEY;\nconst y = process.env.OTHER_KEY;\n")
+        secrets = {s["name"]: s["referenced_in"] for s in self._detect()["required_secrets"]}
+        self.assertEqual(set(secrets), {"MY_KEY", "OTHER_KEY"})
+        # One citation per var per file, even with twenty references in a.js.
+        self.assertEqual({ev["path"] for ev in secrets["MY_KEY"]}, {"a.js", "b.js"})
+        self.assertEqual(len(secrets["MY_KEY"]), 2)
+        self.assertEqual(len(secrets["OTHER_KEY"]), 1)
+
+    def test_common_non_secrets_excluded(self):
+        self._write("package.json", "{}")
+        self._write("a.js", "process.env.NODE_ENV; process.env.PORT; process.env.API_SECRET;\n")
+        secrets = {s["name"] for s in self._detect()["required_secrets"]}
+        self.assertEqual(secrets, {"API_SECRET"})
+
+    def test_api_detection_capped_at_five_files(self):
+        self._write("package.json", "{}")
+        for i in range(8):
+            self._write(f"m{i}.js", 'const s = require("stripe");\nconst s2 = require("stripe");\n')
+        apis = self._detect()["external_apis"]
+        self.assertEqual(len(apis), 1)
+        self.assertEqual(apis[0]["api"], "Stripe")
+        evidence = apis[0]["evidence_files"]
+        self.assertEqual(len(evidence), 5)
+        self.assertEqual(len({ev["path"] for ev in evidence}), 5)
+
+    def test_observability_single_logging_marker(self):
+        self._write("package.json", "{}")
+        for i in range(4):
+            self._write(f"m{i}.js", 'console.log("hi");\napp.get("/health", handler);\n')
+        obs = self._detect()["observability"]
+        self.assertTrue(obs["logging"])
+        self.assertTrue(obs["health_endpoint"])
+        # One logging marker for the whole workspace plus one health
+        # citation per file.
+        self.assertEqual(len(obs["evidence"]), 5)
+
+    def test_skip_dirs_and_minified_files_excluded(self):
+        self._write("package.json", "{}")
+        self._write("node_modules/lib/a.js", 'require("stripe")')
+        self._write("dist/bundle.js", 'require("stripe")')
+        self._write("vendor.min.js", 'require("stripe")')
+        self._write("src/app.js", "app.listen(8080)")
+        profile = self._detect()
+        self.assertEqual(profile["external_apis"], [])
+        self.assertEqual(profile["port_binding"]["port"], 8080)
+
+    def test_minimal_profile_without_runtime_signal(self):
+        # No .replit, no replit.nix, no language manifest, no Dockerfile:
+        # the deep scans are skipped entirely.
+        self._write("notes.js", "app.listen(3000)")
+        profile = self._detect()
+        self.assertFalse(profile["replit_detected"])
+        self.assertIsNone(profile["language"])
+        self.assertIsNone(profile["port_binding"])
+        self.assertEqual(profile["required_secrets"], [])
+        self.assertEqual(profile["external_apis"], [])
+        self.assertEqual(profile["scan_truncated_files"], 0)
+        self.assertIn("deployment_assumptions", profile)
+
+    def test_language_manifest_enables_deep_scan(self):
+        self._write("package.json", "{}")
+        self._write("notes.js", "app.listen(3000)")
+        profile = self._detect()
+        self.assertEqual(profile["language"], "nodejs")
+        self.assertEqual(profile["port_binding"]["port"], 3000)
+
+    def test_detect_result_cached_on_instance(self):
+        self._write("package.json", "{}")
+        self._write("a.js", "app.listen(3000)")
+        profiler = ReplitProfiler(self.root)
+        first = profiler.detect()
+        self._write("b.js", "app.listen(4000)")
+        self.assertIs(profiler.detect(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()